@@ -0,0 +1,41 @@
+"""Index meal plan foreign keys
+
+Revision ID: a2c4e6f8b0d1
+Revises: f1a9c3d7e2b4
+Create Date: 2026-02-17 11:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c4e6f8b0d1'
+down_revision: Union[str, None] = 'f1a9c3d7e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction, and doesn't
+    # block writes to the table while the index builds.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_meals_meal_plan_id'), 'meals', ['meal_plan_id'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_ingredients_meal_id'), 'ingredients', ['meal_id'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_ingredients_product_id'), 'ingredients', ['product_id'],
+                        unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_ingredients_product_id'), table_name='ingredients',
+                      postgresql_concurrently=True)
+        op.drop_index(op.f('ix_ingredients_meal_id'), table_name='ingredients',
+                      postgresql_concurrently=True)
+        op.drop_index(op.f('ix_meals_meal_plan_id'), table_name='meals',
+                      postgresql_concurrently=True)
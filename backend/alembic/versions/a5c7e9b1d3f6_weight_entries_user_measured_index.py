@@ -0,0 +1,39 @@
+"""Composite (user_id, measured_at DESC) index on weight_entries
+
+Revision ID: a5c7e9b1d3f6
+Revises: f4b6d8e0a2c9
+Create Date: 2026-02-25 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c7e9b1d3f6'
+down_revision: Union[str, None] = 'f4b6d8e0a2c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_weight_entries_user_measured', 'weight_entries',
+                        ['user_id', sa.text('measured_at DESC')],
+                        unique=False, postgresql_concurrently=True)
+        # user_id is the leading column of the new index, so the old
+        # single-column index only costs writes now
+        op.drop_index('ix_weight_entries_user_id', table_name='weight_entries',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_weight_entries_user_id', 'weight_entries', ['user_id'],
+                        unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_weight_entries_user_measured', table_name='weight_entries',
+                      postgresql_concurrently=True)
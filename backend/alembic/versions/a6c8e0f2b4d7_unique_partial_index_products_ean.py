@@ -0,0 +1,36 @@
+"""Unique partial index on products.ean
+
+Revision ID: a6c8e0f2b4d7
+Revises: f5b7d9e1a3c6
+Create Date: 2026-02-28 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c8e0f2b4d7'
+down_revision: Union[str, None] = 'f5b7d9e1a3c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if two products share an EAN - scripts/pipeline/off_verify.py
+    # lists any duplicates to clean up first.
+    with op.get_context().autocommit_block():
+        op.create_index('uq_products_ean', 'products', ['ean'],
+                        unique=True,
+                        postgresql_where=sa.text('ean IS NOT NULL'),
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('uq_products_ean', table_name='products',
+                      postgresql_concurrently=True)
@@ -0,0 +1,74 @@
+"""Let the weight_entries trigger also fill in users.starting_weight_kg
+
+Revision ID: a7d9f1b3c5e8
+Revises: f6c8e0a2b4d7
+Create Date: 2026-03-02 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d9f1b3c5e8'
+down_revision: Union[str, None] = 'f6c8e0a2b4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_function(set_starting_weight: bool) -> None:
+    """(Re)create sync_user_current_weight(); the trigger itself is unchanged."""
+    if set_starting_weight:
+        # A new entry for a user without a starting weight (skipped in the
+        # intake form) becomes their starting weight
+        starting_weight = (
+            ", starting_weight_kg = COALESCE(u.starting_weight_kg, inserted_weight)"
+        )
+        starting_weight_missing = (
+            " OR (u.starting_weight_kg IS NULL AND inserted_weight IS NOT NULL)"
+        )
+    else:
+        starting_weight = starting_weight_missing = ""
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION sync_user_current_weight() RETURNS trigger AS $$
+        DECLARE
+            affected_user uuid;
+            inserted_weight double precision;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                affected_user := OLD.user_id;
+            ELSE
+                affected_user := NEW.user_id;
+            END IF;
+            IF TG_OP = 'INSERT' THEN
+                inserted_weight := NEW.weight_kg;
+            END IF;
+
+            UPDATE users u
+            SET current_weight_kg = latest.weight_kg{starting_weight}
+            FROM (
+                SELECT weight_kg
+                FROM weight_entries
+                WHERE user_id = affected_user
+                ORDER BY measured_at DESC
+                LIMIT 1
+            ) AS latest
+            WHERE u.id = affected_user
+              AND (u.current_weight_kg IS DISTINCT FROM latest.weight_kg{starting_weight_missing});
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _create_function(set_starting_weight=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _create_function(set_starting_weight=False)
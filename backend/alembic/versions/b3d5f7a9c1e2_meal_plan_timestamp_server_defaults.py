@@ -0,0 +1,38 @@
+"""Server-side defaults for meal_plans timestamps
+
+Revision ID: b3d5f7a9c1e2
+Revises: a2c4e6f8b0d1
+Create Date: 2026-02-22 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c1e2'
+down_revision: Union[str, None] = 'a2c4e6f8b0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+
+def upgrade() -> None:
+    # Setting a column DEFAULT only touches the catalog, existing rows keep
+    # their values and the table is not rewritten.
+    for column in ('created_at', 'updated_at'):
+        op.alter_column('meal_plans', column,
+                        existing_type=sa.DateTime(),
+                        existing_nullable=False,
+                        server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for column in ('created_at', 'updated_at'):
+        op.alter_column('meal_plans', column,
+                        existing_type=sa.DateTime(),
+                        existing_nullable=False,
+                        server_default=None)
@@ -0,0 +1,48 @@
+"""Store users.dietary_restrictions as text[]
+
+Revision ID: b7d9f1a3c5e8
+Revises: a5c7e9b1d3f6
+Create Date: 2026-02-25 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d9f1a3c5e8'
+down_revision: Union[str, None] = 'a5c7e9b1d3f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # "vegetarian, gluten-free" -> {vegetarian,gluten-free}; blank -> NULL
+    op.execute(r"""
+        ALTER TABLE users ALTER COLUMN dietary_restrictions TYPE text[]
+        USING CASE
+            WHEN btrim(coalesce(dietary_restrictions, '')) = '' THEN NULL
+            ELSE array_remove(
+                regexp_split_to_array(btrim(dietary_restrictions), '\s*,\s*'), ''
+            )
+        END
+    """)
+
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_dietary_restrictions', 'users', ['dietary_restrictions'],
+                        unique=False, postgresql_using='gin',
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_dietary_restrictions', table_name='users',
+                      postgresql_concurrently=True)
+
+    op.execute(
+        "ALTER TABLE users ALTER COLUMN dietary_restrictions TYPE text "
+        "USING array_to_string(dietary_restrictions, ',')"
+    )
@@ -0,0 +1,34 @@
+"""Server-side default for product_availability.last_verified
+
+Revision ID: b8e0a2c4d6f9
+Revises: a6c8e0f2b4d7
+Create Date: 2026-02-28 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e0a2c4d6f9'
+down_revision: Union[str, None] = 'a6c8e0f2b4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('product_availability', 'last_verified',
+                    existing_type=sa.Date(),
+                    existing_nullable=True,
+                    server_default=sa.text('CURRENT_DATE'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('product_availability', 'last_verified',
+                    existing_type=sa.Date(),
+                    existing_nullable=True,
+                    server_default=None)
@@ -0,0 +1,33 @@
+"""Index products on their listing order (category, name, id)
+
+Revision ID: b9e1f3a5c7d0
+Revises: a7d9f1b3c5e8
+Create Date: 2026-03-03 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e1f3a5c7d0'
+down_revision: Union[str, None] = 'a7d9f1b3c5e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_products_category_name_id', 'products',
+                        ['category', 'name', 'id'],
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_products_category_name_id', table_name='products',
+                      postgresql_concurrently=True)
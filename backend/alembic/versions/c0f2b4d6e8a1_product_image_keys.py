@@ -0,0 +1,75 @@
+"""Store product images as keys relative to the OFF image host
+
+Revision ID: c0f2b4d6e8a1
+Revises: b8e0a2c4d6f9
+Create Date: 2026-03-01 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0f2b4d6e8a1'
+down_revision: Union[str, None] = 'b8e0a2c4d6f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match OFF_IMAGE_BASE in app/models/product.py
+OFF_IMAGE_BASE = 'https://images.openfoodfacts.org/images/products/'
+BATCH_SIZE = 10000
+
+# (old column, new column)
+COLUMNS = [
+    ('image_url', 'image_key'),
+    ('image_thumb_url', 'image_thumb_key'),
+]
+
+
+def _rewrite_in_batches(set_sql: str, where_sql: str) -> None:
+    """
+    Apply "UPDATE products SET <set_sql> WHERE <where_sql>" in batches.
+
+    Each batch commits on its own, so a big products table is never locked
+    as a whole and the rewritten rows can be vacuumed as we go.
+    """
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        while True:
+            result = bind.execute(
+                sa.text(
+                    f"UPDATE products SET {set_sql} "
+                    f"WHERE id IN (SELECT id FROM products WHERE {where_sql} LIMIT :batch)"
+                ),
+                {'base': OFF_IMAGE_BASE, 'batch': BATCH_SIZE},
+            )
+            if result.rowcount == 0:
+                break
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Renaming is a catalog-only change; no rows are rewritten here.
+    for old, new in COLUMNS:
+        op.alter_column('products', old, new_column_name=new)
+
+    # Strip the shared prefix (starts_with() skips LIKE-escaping the base)
+    for _, column in COLUMNS:
+        _rewrite_in_batches(
+            f"{column} = substr({column}, length(:base) + 1)",
+            f"starts_with({column}, :base)",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for _, column in COLUMNS:
+        _rewrite_in_batches(
+            f"{column} = :base || {column}",
+            f"{column} IS NOT NULL AND {column} NOT LIKE 'http%'",
+        )
+
+    for old, new in COLUMNS:
+        op.alter_column('products', new, new_column_name=old)
@@ -0,0 +1,49 @@
+"""Materialized view with the /products/stats counts
+
+Revision ID: c1f3a5b7d9e2
+Revises: b9e1f3a5c7d0
+Create Date: 2026-03-03 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1f3a5b7d9e2'
+down_revision: Union[str, None] = 'b9e1f3a5c7d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # All four numbers come from ONE scan of products: counts per data_source
+    # first, then summed up. The view always has exactly one row.
+    op.execute("""
+        CREATE MATERIALIZED VIEW product_stats_mv AS
+        WITH per_source AS (
+            SELECT
+                data_source,
+                count(*) AS total,
+                count(*) FILTER (WHERE is_curated) AS curated,
+                count(*) FILTER (WHERE calories_per_100g IS NOT NULL) AS with_nutrition
+            FROM products
+            GROUP BY data_source
+        )
+        SELECT
+            1 AS id,
+            coalesce(sum(total), 0)::bigint AS total,
+            coalesce(jsonb_object_agg(data_source, total), '{}'::jsonb) AS by_source,
+            coalesce(sum(curated), 0)::bigint AS curated,
+            coalesce(sum(with_nutrition), 0)::bigint AS with_nutrition
+        FROM per_source
+    """)
+    # REFRESH ... CONCURRENTLY needs a unique index on the view
+    op.execute("CREATE UNIQUE INDEX uq_product_stats_mv_id ON product_stats_mv (id)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS product_stats_mv")
@@ -17,12 +17,18 @@ down_revision: Union[str, None] = 'b39bb66bf7a7'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+BACKFILL_BATCH_SIZE = 10000
+
 
 def upgrade() -> None:
     # --- Add new columns to products table ---
 
     # Data provenance
-    op.add_column('products', sa.Column('data_source', sa.String(50), nullable=True))
+    # LEARNING NOTE: data_source gets its server_default in the same ADD COLUMN.
+    # On PostgreSQL 11+ a constant default is stored in the catalog, so existing
+    # rows read back as 'manual' without rewriting the table.
+    op.add_column('products', sa.Column('data_source', sa.String(50), nullable=True,
+                                        server_default='manual'))
     op.add_column('products', sa.Column('data_confidence', sa.Float(), nullable=True))
     op.add_column('products', sa.Column('is_curated', sa.Boolean(), nullable=True))
 
@@ -42,19 +48,43 @@ def upgrade() -> None:
     op.alter_column('products', 'package_size', existing_type=sa.Float(), nullable=True)
     op.alter_column('products', 'unit', existing_type=sa.String(50), nullable=True)
 
-    # Backfill existing products as manual/curated
-    op.execute("UPDATE products SET data_source = 'manual', is_curated = true, data_confidence = 1.0")
-
-    # Now set NOT NULL on data_source and is_curated with defaults
-    op.alter_column('products', 'data_source',
-                    existing_type=sa.String(50),
-                    nullable=False,
-                    server_default='manual')
+    # Backfill existing products as manual/curated, in PK-ordered batches.
+    # Each batch commits on its own so row locks are released between batches
+    # instead of holding the whole table for one unbounded UPDATE.
+    # The values here are constants, so a plain UPDATE ... WHERE id = ANY(...)
+    # is already one statement per batch. Loads that carry per-row values
+    # belong in the import scripts (COPY via scripts/pipeline/utils.bulk_insert).
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        while True:
+            ids = bind.execute(sa.text(
+                "SELECT id FROM products WHERE is_curated IS NULL "
+                "ORDER BY id LIMIT :batch_size"
+            ), {"batch_size": BACKFILL_BATCH_SIZE}).scalars().all()
+            if not ids:
+                break
+            bind.execute(sa.text(
+                "UPDATE products SET is_curated = true, data_confidence = 1.0 "
+                "WHERE id = ANY(:ids)"
+            ), {"ids": list(ids)})
+
+    # New rows default to not curated
     op.alter_column('products', 'is_curated',
                     existing_type=sa.Boolean(),
-                    nullable=False,
                     server_default=sa.text('false'))
 
+    # NOT NULL is enforced through CHECK constraints added as NOT VALID, which
+    # skips the full-table scan here. They are validated (and swapped for real
+    # NOT NULL) in the follow-up migration d7e3b0a41c52 under a weaker lock.
+    op.execute(
+        "ALTER TABLE products ADD CONSTRAINT ck_products_data_source_not_null "
+        "CHECK (data_source IS NOT NULL) NOT VALID"
+    )
+    op.execute(
+        "ALTER TABLE products ADD CONSTRAINT ck_products_is_curated_not_null "
+        "CHECK (is_curated IS NOT NULL) NOT VALID"
+    )
+
     # Indexes on products
     op.create_index('idx_products_data_source', 'products', ['data_source'])
     op.create_index('idx_products_off_id', 'products', ['off_id'])
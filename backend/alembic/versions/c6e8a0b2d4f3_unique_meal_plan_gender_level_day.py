@@ -0,0 +1,34 @@
+"""Unique index on meal_plans (gender, level, day_number)
+
+Revision ID: c6e8a0b2d4f3
+Revises: b3d5f7a9c1e2
+Create Date: 2026-02-22 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e8a0b2d4f3'
+down_revision: Union[str, None] = 'b3d5f7a9c1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built CONCURRENTLY (outside a transaction) so the table stays writable.
+    # Fails if duplicate plans already exist - re-run the import script first.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_meal_plans_gender_level_day', 'meal_plans',
+                        ['gender', 'level', 'day_number'],
+                        unique=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_meal_plans_gender_level_day', table_name='meal_plans',
+                      postgresql_concurrently=True)
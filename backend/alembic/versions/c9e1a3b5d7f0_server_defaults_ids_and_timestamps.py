@@ -0,0 +1,75 @@
+"""Server-side defaults for remaining ids and timestamps
+
+Revision ID: c9e1a3b5d7f0
+Revises: b7d9f1a3c5e8
+Create Date: 2026-02-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e1a3b5d7f0'
+down_revision: Union[str, None] = 'b7d9f1a3c5e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UTC_NOW = sa.text("timezone('utc', now())")
+GEN_RANDOM_UUID = sa.text("gen_random_uuid()")
+
+# Ids the ORM fills with UUIDv7; the server default covers non-ORM inserts
+UUID_ID_TABLES = [
+    'products',
+    'product_availability',
+    'product_alternatives',
+    'product_source_links',
+    'user_preferences',
+    'weight_entries',
+]
+
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('products', 'created_at'),
+    ('products', 'updated_at'),
+    ('product_availability', 'created_at'),
+    ('product_availability', 'updated_at'),
+    ('product_alternatives', 'created_at'),
+    ('product_source_links', 'matched_at'),
+    ('user_preferences', 'created_at'),
+    ('user_preferences', 'updated_at'),
+    ('weight_entries', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only column DEFAULTs change (catalog updates), no table is rewritten.
+    # gen_random_uuid() comes from pgcrypto, enabled in f1a9c3d7e2b4.
+    for table in UUID_ID_TABLES:
+        op.alter_column(table, 'id',
+                        existing_type=sa.Uuid(as_uuid=False),
+                        existing_nullable=False,
+                        server_default=GEN_RANDOM_UUID)
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.DateTime(),
+                        existing_nullable=False,
+                        server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.DateTime(),
+                        existing_nullable=False,
+                        server_default=None)
+    for table in UUID_ID_TABLES:
+        op.alter_column(table, 'id',
+                        existing_type=sa.Uuid(as_uuid=False),
+                        existing_nullable=False,
+                        server_default=None)
@@ -0,0 +1,52 @@
+"""Store user_preferences.preference as smallint codes
+
+Revision ID: d1f3b5c7e9a2
+Revises: c9e1a3b5d7f0
+Create Date: 2026-02-26 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3b5c7e9a2'
+down_revision: Union[str, None] = 'c9e1a3b5d7f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match PREFERENCE_CODES in app/models/preference.py
+preferencetype_enum = postgresql.ENUM('LIKED', 'DISLIKED', 'NEUTRAL',
+                                      name='preferencetype', create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        ALTER TABLE user_preferences ALTER COLUMN preference TYPE smallint
+        USING CASE preference
+            WHEN 'LIKED' THEN 1
+            WHEN 'DISLIKED' THEN 2
+            WHEN 'NEUTRAL' THEN 3
+        END
+    """)
+    op.create_check_constraint('ck_user_preferences_preference', 'user_preferences',
+                               'preference IN (1, 2, 3)')
+    # No other column uses the ENUM type any more
+    preferencetype_enum.drop(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    preferencetype_enum.create(op.get_bind(), checkfirst=True)
+    op.drop_constraint('ck_user_preferences_preference', 'user_preferences', type_='check')
+    op.execute("""
+        ALTER TABLE user_preferences ALTER COLUMN preference TYPE preferencetype
+        USING (CASE preference
+            WHEN 1 THEN 'LIKED'
+            WHEN 2 THEN 'DISLIKED'
+            WHEN 3 THEN 'NEUTRAL'
+        END)::preferencetype
+    """)
@@ -0,0 +1,34 @@
+"""Covering index for product_alternatives lookups
+
+Revision ID: d2a4c6e8f0b3
+Revises: c0f2b4d6e8a1
+Create Date: 2026-03-01 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a4c6e8f0b3'
+down_revision: Union[str, None] = 'c0f2b4d6e8a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_alt_covering', 'product_alternatives',
+                        ['original_product_id', 'priority'],
+                        postgresql_include=['alternative_product_id', 'reason'],
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_alt_covering', table_name='product_alternatives',
+                      postgresql_concurrently=True)
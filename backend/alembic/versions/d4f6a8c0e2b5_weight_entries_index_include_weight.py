@@ -0,0 +1,44 @@
+"""Include weight_kg in the weight_entries (user_id, measured_at) index
+
+Revision ID: d4f6a8c0e2b5
+Revises: c1f3a5b7d9e2
+Create Date: 2026-03-09 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f6a8c0e2b5'
+down_revision: Union[str, None] = 'c1f3a5b7d9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _swap_index(new: str, old: str, include: list[str]) -> None:
+    """Build `new` next to `old`, move the CLUSTER mark over, drop `old`."""
+    with op.get_context().autocommit_block():
+        op.create_index(new, 'weight_entries',
+                        ['user_id', sa.text('measured_at DESC')],
+                        unique=True,
+                        postgresql_include=include,
+                        postgresql_concurrently=True)
+    op.execute(f"ALTER TABLE weight_entries CLUSTER ON {new}")
+    with op.get_context().autocommit_block():
+        op.drop_index(old, table_name='weight_entries',
+                      postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _swap_index('uq_weight_entries_user_measured_weight',
+                'uq_weight_entries_user_measured', include=['weight_kg'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _swap_index('uq_weight_entries_user_measured',
+                'uq_weight_entries_user_measured_weight', include=[])
@@ -0,0 +1,49 @@
+"""Validate product pipeline NOT NULL constraints
+
+Revision ID: d7e3b0a41c52
+Revises: c4a1f2d89e3b
+Create Date: 2026-02-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e3b0a41c52'
+down_revision: Union[str, None] = 'c4a1f2d89e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # LEARNING NOTE:
+    # VALIDATE CONSTRAINT only takes a SHARE UPDATE EXCLUSIVE lock, so reads and
+    # writes on products keep flowing while the table is scanned. Once a valid
+    # CHECK (col IS NOT NULL) exists, PostgreSQL 12+ uses it to skip the scan
+    # for SET NOT NULL, and the helper constraints can be dropped.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE products VALIDATE CONSTRAINT ck_products_data_source_not_null")
+        op.execute("ALTER TABLE products VALIDATE CONSTRAINT ck_products_is_curated_not_null")
+
+    op.alter_column('products', 'data_source', existing_type=sa.String(50), nullable=False)
+    op.alter_column('products', 'is_curated', existing_type=sa.Boolean(), nullable=False)
+
+    op.drop_constraint('ck_products_data_source_not_null', 'products', type_='check')
+    op.drop_constraint('ck_products_is_curated_not_null', 'products', type_='check')
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE products ADD CONSTRAINT ck_products_data_source_not_null "
+        "CHECK (data_source IS NOT NULL) NOT VALID"
+    )
+    op.execute(
+        "ALTER TABLE products ADD CONSTRAINT ck_products_is_curated_not_null "
+        "CHECK (is_curated IS NOT NULL) NOT VALID"
+    )
+
+    op.alter_column('products', 'data_source', existing_type=sa.String(50), nullable=True)
+    op.alter_column('products', 'is_curated', existing_type=sa.Boolean(), nullable=True)
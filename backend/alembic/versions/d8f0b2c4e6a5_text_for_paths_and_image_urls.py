@@ -0,0 +1,45 @@
+"""Use text for meal_plans.pdf_path and product image URLs
+
+Revision ID: d8f0b2c4e6a5
+Revises: c6e8a0b2d4f3
+Create Date: 2026-02-23 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f0b2c4e6a5'
+down_revision: Union[str, None] = 'c6e8a0b2d4f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TEXT_COLUMNS = [
+    ('meal_plans', 'pdf_path'),
+    ('products', 'image_url'),
+    ('products', 'image_thumb_url'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # varchar -> text is binary compatible in PostgreSQL, so this only
+    # updates the catalog; the table is not rewritten.
+    for table, column in TEXT_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.String(length=500),
+                        type_=sa.Text(),
+                        existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Fails if a value longer than 500 characters was stored in the meantime
+    for table, column in TEXT_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.Text(),
+                        type_=sa.String(length=500),
+                        existing_nullable=True)
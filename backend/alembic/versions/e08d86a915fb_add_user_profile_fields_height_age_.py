@@ -38,9 +38,13 @@ def upgrade() -> None:
     op.add_column('users', sa.Column('profile_picture_url', sa.String(length=500), nullable=True))
 
     # Allow gender to be nullable (for users who haven't completed intake)
-    op.alter_column('users', 'gender',
-               existing_type=postgresql.ENUM('MALE', 'FEMALE', name='gender'),
-               nullable=True)
+    # LEARNING NOTE: DROP NOT NULL is a catalog-only change, but inside the
+    # migration transaction its ACCESS EXCLUSIVE lock would be held until every
+    # ADD COLUMN above commits. Running it in its own autocommit block releases
+    # the lock immediately, and the raw statement guarantees no redundant
+    # "ALTER COLUMN ... TYPE gender" restatement is emitted alongside it.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE users ALTER COLUMN gender DROP NOT NULL")
 
 
 def downgrade() -> None:
@@ -0,0 +1,42 @@
+"""Native uuid primary keys for the remaining tables
+
+Revision ID: e2a4c6e8f0b7
+Revises: d8f0b2c4e6a5
+Create Date: 2026-02-24 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6e8f0b7'
+down_revision: Union[str, None] = 'd8f0b2c4e6a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose primary key is still varchar(36). Their foreign-key columns
+# were already converted in f1a9c3d7e2b4, and nothing references these ids,
+# so no constraints need to be dropped and recreated.
+TABLES = [
+    'weight_entries',
+    'user_preferences',
+    'product_availability',
+    'product_alternatives',
+    'product_source_links',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # New ids are generated in Python as UUIDv7 (app/models/ids.py), so no
+    # server default is added here.
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE uuid USING id::uuid")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE varchar(36) USING id::text")
@@ -0,0 +1,31 @@
+"""Mark weight_entries to be clustered by (user_id, measured_at)
+
+Revision ID: e3a5c7d9f1b4
+Revises: d1f3b5c7e9a2
+Create Date: 2026-02-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a5c7d9f1b4'
+down_revision: Union[str, None] = 'd1f3b5c7e9a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only records which index CLUSTER should use (catalog change, no lock on
+    # the data). The actual reordering rewrites the table under an exclusive
+    # lock, so it is left to a maintenance window:
+    #     CLUSTER weight_entries;
+    op.execute("ALTER TABLE weight_entries CLUSTER ON ix_weight_entries_user_measured")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE weight_entries SET WITHOUT CLUSTER")
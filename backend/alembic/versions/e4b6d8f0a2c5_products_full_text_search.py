@@ -0,0 +1,45 @@
+"""Full-text search column and GIN index on products
+
+Revision ID: e4b6d8f0a2c5
+Revises: d2a4c6e8f0b3
+Create Date: 2026-03-02 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b6d8f0a2c5'
+down_revision: Union[str, None] = 'd2a4c6e8f0b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A STORED generated column is computed for every existing row, so this
+    # rewrites the products table once.
+    op.add_column('products', sa.Column(
+        'search_vec',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(brand, ''))",
+            persisted=True,
+        ),
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index('products_search_gin', 'products', ['search_vec'],
+                        postgresql_using='gin',
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('products_search_gin', table_name='products',
+                      postgresql_concurrently=True)
+    op.drop_column('products', 'search_vec')
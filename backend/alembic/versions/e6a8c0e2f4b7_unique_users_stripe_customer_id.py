@@ -0,0 +1,45 @@
+"""Unique partial index on users.stripe_customer_id
+
+Revision ID: e6a8c0e2f4b7
+Revises: d4f6a8c0e2b5
+Create Date: 2026-03-10 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a8c0e2f4b7'
+down_revision: Union[str, None] = 'd4f6a8c0e2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if two users share a Stripe customer. Find them with:
+    #     SELECT stripe_customer_id FROM users
+    #     WHERE stripe_customer_id IS NOT NULL
+    #     GROUP BY 1 HAVING count(*) > 1;
+    with op.get_context().autocommit_block():
+        op.create_index('uq_users_stripe_customer_id', 'users',
+                        ['stripe_customer_id'],
+                        unique=True,
+                        postgresql_where=sa.text('stripe_customer_id IS NOT NULL'),
+                        postgresql_concurrently=True)
+        op.drop_index('ix_users_stripe_customer_id', table_name='users',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_stripe_customer_id', 'users',
+                        ['stripe_customer_id'],
+                        unique=False,
+                        postgresql_concurrently=True)
+        op.drop_index('uq_users_stripe_customer_id', table_name='users',
+                      postgresql_concurrently=True)
@@ -0,0 +1,102 @@
+"""Store primary and foreign keys as native uuid
+
+Revision ID: f1a9c3d7e2b4
+Revises: d7e3b0a41c52
+Create Date: 2026-02-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a9c3d7e2b4'
+down_revision: Union[str, None] = 'd7e3b0a41c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (constraint, table, column, referred table, ondelete)
+FOREIGN_KEYS = [
+    ('meals_meal_plan_id_fkey', 'meals', 'meal_plan_id', 'meal_plans', 'CASCADE'),
+    ('ingredients_meal_id_fkey', 'ingredients', 'meal_id', 'meals', 'CASCADE'),
+    ('ingredients_product_id_fkey', 'ingredients', 'product_id', 'products', None),
+    ('user_preferences_user_id_fkey', 'user_preferences', 'user_id', 'users', 'CASCADE'),
+    ('user_preferences_meal_plan_id_fkey', 'user_preferences', 'meal_plan_id', 'meal_plans', 'CASCADE'),
+    ('weight_entries_user_id_fkey', 'weight_entries', 'user_id', 'users', 'CASCADE'),
+    ('product_availability_product_id_fkey', 'product_availability', 'product_id', 'products', 'CASCADE'),
+    ('product_alternatives_original_product_id_fkey', 'product_alternatives', 'original_product_id', 'products', 'CASCADE'),
+    ('product_alternatives_alternative_product_id_fkey', 'product_alternatives', 'alternative_product_id', 'products', 'CASCADE'),
+    ('product_source_links_product_id_fkey', 'product_source_links', 'product_id', 'products', 'CASCADE'),
+]
+
+# Columns converted per table. Columns of one table are altered in a single
+# ALTER TABLE so the table is rewritten once (and ck_different_products never
+# sees mixed types).
+UUID_COLUMNS = {
+    'users': ['id'],
+    'meal_plans': ['id'],
+    'meals': ['id', 'meal_plan_id'],
+    'products': ['id'],
+    'ingredients': ['id', 'meal_id', 'product_id'],
+    'user_preferences': ['user_id', 'meal_plan_id'],
+    'weight_entries': ['user_id'],
+    'product_availability': ['product_id'],
+    'product_alternatives': ['original_product_id', 'alternative_product_id'],
+    'product_source_links': ['product_id'],
+}
+
+# Tables whose new rows get their id from the database
+SERVER_GENERATED_IDS = ['users', 'meal_plans', 'meals', 'ingredients']
+
+
+def _drop_foreign_keys() -> None:
+    for name, table, _, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+
+def _create_foreign_keys() -> None:
+    for name, table, column, referred, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    _drop_foreign_keys()
+
+    for table, columns in UUID_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {c} TYPE uuid USING {c}::uuid" for c in columns)
+        )
+
+    _create_foreign_keys()
+
+    for table in SERVER_GENERATED_IDS:
+        op.alter_column(table, 'id',
+                        existing_type=postgresql.UUID(),
+                        server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SERVER_GENERATED_IDS:
+        op.alter_column(table, 'id',
+                        existing_type=postgresql.UUID(),
+                        server_default=None)
+
+    _drop_foreign_keys()
+
+    for table, columns in UUID_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {c} TYPE varchar(36) USING {c}::text" for c in columns)
+        )
+
+    _create_foreign_keys()
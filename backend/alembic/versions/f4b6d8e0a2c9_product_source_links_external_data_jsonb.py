@@ -0,0 +1,35 @@
+"""Store product_source_links.external_data as jsonb
+
+Revision ID: f4b6d8e0a2c9
+Revises: e2a4c6e8f0b7
+Create Date: 2026-02-24 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b6d8e0a2c9'
+down_revision: Union[str, None] = 'e2a4c6e8f0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing text snapshots are parsed once here; the cast fails loudly if
+    # a row does not hold valid JSON.
+    op.execute(
+        "ALTER TABLE product_source_links "
+        "ALTER COLUMN external_data TYPE jsonb USING external_data::jsonb"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "ALTER TABLE product_source_links "
+        "ALTER COLUMN external_data TYPE text USING external_data::text"
+    )
@@ -0,0 +1,67 @@
+"""Keep users.current_weight_kg in sync with weight_entries via a trigger
+
+Revision ID: f5b7d9e1a3c6
+Revises: e3a5c7d9f1b4
+Create Date: 2026-02-27 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b7d9e1a3c6'
+down_revision: Union[str, None] = 'e3a5c7d9f1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # After any change to a user's weight entries, copy the weight of their
+    # latest entry onto users.current_weight_kg. The lookup is one probe of
+    # ix_weight_entries_user_measured. If the user has no entries left the
+    # stored value is kept (it may come from the intake form).
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_user_current_weight() RETURNS trigger AS $$
+        DECLARE
+            affected_user uuid;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                affected_user := OLD.user_id;
+            ELSE
+                affected_user := NEW.user_id;
+            END IF;
+
+            UPDATE users u
+            SET current_weight_kg = latest.weight_kg
+            FROM (
+                SELECT weight_kg
+                FROM weight_entries
+                WHERE user_id = affected_user
+                ORDER BY measured_at DESC
+                LIMIT 1
+            ) AS latest
+            WHERE u.id = affected_user
+              AND u.current_weight_kg IS DISTINCT FROM latest.weight_kg;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_weight_entries_sync_user_current_weight
+        AFTER INSERT OR DELETE OR UPDATE OF weight_kg, measured_at
+        ON weight_entries
+        FOR EACH ROW EXECUTE FUNCTION sync_user_current_weight()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_weight_entries_sync_user_current_weight "
+        "ON weight_entries"
+    )
+    op.execute("DROP FUNCTION IF EXISTS sync_user_current_weight()")
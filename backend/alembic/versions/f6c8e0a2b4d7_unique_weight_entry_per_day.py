@@ -0,0 +1,46 @@
+"""Make the weight_entries (user_id, measured_at) index unique
+
+Revision ID: f6c8e0a2b4d7
+Revises: e4b6d8f0a2c5
+Create Date: 2026-03-02 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6c8e0a2b4d7'
+down_revision: Union[str, None] = 'e4b6d8f0a2c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _swap_index(new: str, old: str, unique: bool) -> None:
+    """Build `new` next to `old`, move the CLUSTER mark over, drop `old`."""
+    with op.get_context().autocommit_block():
+        op.create_index(new, 'weight_entries',
+                        ['user_id', sa.text('measured_at DESC')],
+                        unique=unique,
+                        postgresql_concurrently=True)
+    op.execute(f"ALTER TABLE weight_entries CLUSTER ON {new}")
+    with op.get_context().autocommit_block():
+        op.drop_index(old, table_name='weight_entries',
+                      postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if a user already has two entries for the same day. Find them with:
+    #     SELECT user_id, measured_at FROM weight_entries
+    #     GROUP BY 1, 2 HAVING count(*) > 1;
+    _swap_index('uq_weight_entries_user_measured',
+                'ix_weight_entries_user_measured', unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _swap_index('ix_weight_entries_user_measured',
+                'uq_weight_entries_user_measured', unique=False)
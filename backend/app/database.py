@@ -12,32 +12,152 @@ TUTORIALS:
 - FastAPI + SQLAlchemy: https://fastapi.tiangolo.com/tutorial/sql-databases/
 """
 
-from sqlalchemy import create_engine
+from fastapi import Depends
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import NullPool
 from app.config import get_settings
 
 settings = get_settings()
 
 # Create the database engine
 # LEARNING NOTE:
-# - echo=True prints all SQL queries to console (helpful for learning!)
+# - echo=True prints all SQL queries to console (helpful for learning!), but it
+#   pushes every query through Python logging, so it's opt-in via SQL_ECHO
+#   instead of following DEBUG
 # - pool_pre_ping=True checks if connection is alive before using it
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,  # Print SQL queries when in debug mode
-    pool_pre_ping=True,
-)
+# - pool_size/max_overflow: how many connections are kept open / may be opened
+#   on top during bursts (the defaults of 5/10 saturate quickly under load).
+#   The limit is per process: with several uvicorn workers, the database (or
+#   a pooler like Supabase's) sees workers x (pool_size + max_overflow)
+# - pool_recycle replaces connections older than N seconds before the server
+#   (or a proxy in between) silently drops them
+# - pool_timeout: how long a request waits for a free connection before
+#   failing with an error, instead of hanging when the pool is exhausted
+# - statement_timeout: see apply_statement_timeout() below (API only)
+# - pool_use_lifo=True reuses the most recently returned connection, so idle
+#   extras age out and get recycled instead of all staying warm
+# - query_cache_size: SQLAlchemy compiles each distinct statement *shape* to
+#   SQL once and reuses it. Values in filters (User.id == user_id) are always
+#   sent as bound parameters, so the same query with a different id is a cache
+#   hit. The default of 500 entries is raised so the ORM statements of every
+#   endpoint (plus their eager-load variants) fit without evicting each other.
+# - db_external_pooler: behind PgBouncer (or Supabase's transaction pooler on
+#   port 6543) the pooler already keeps the server connections open and
+#   shares them between all workers. A second pool in each process would just
+#   hold pooler slots idle, so NullPool opens a (cheap, local) pooler
+#   connection per checkout and closes it right after.
+#   A transaction pooler also hands each *transaction* to whichever server
+#   connection is free, so per-connection settings can't be used there:
+#   PgBouncer rejects libpq startup options, and a plain SET would stick to
+#   a server connection other clients get next. Settings are applied per
+#   transaction instead (SET LOCAL / SET TRANSACTION, see _on_begin).
+def _on_begin(db_engine, *statements: str) -> None:
+    """Run `statements` at the start of every transaction on `db_engine`."""
+    def run_statements(connection):
+        # Straight on the DBAPI connection: psycopg2 opens the transaction
+        # with the first statement, so these apply to exactly that transaction
+        with connection.connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    event.listen(db_engine, "begin", run_statements)
+
+
+def _create_engine(url: str, read_only: bool = False):
+    """Engine with the app's pool settings; read_only for replicas."""
+    connect_args = {}
+    if read_only and not settings.db_external_pooler:
+        connect_args["options"] = "-c default_transaction_read_only=on"
+    if settings.db_external_pooler:
+        pool_args = {"poolclass": NullPool}
+    else:
+        pool_args = {
+            "pool_pre_ping": True,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_use_lifo": True,
+        }
+    db_engine = create_engine(
+        url,
+        echo=settings.sql_echo,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args=connect_args,
+        **pool_args,
+    )
+    if read_only and settings.db_external_pooler:
+        _on_begin(db_engine, "SET TRANSACTION READ ONLY")
+    return db_engine
+
+
+engine = _create_engine(settings.database_url)
+
+# Optional read-only replica for heavy read endpoints (see get_read_db).
+# Same pool settings as the primary; nothing is ever written through it.
+read_engine = None
+if settings.database_read_url:
+    read_engine = _create_engine(settings.database_read_url, read_only=True)
+
+def apply_statement_timeout() -> None:
+    """
+    Limit every SQL statement the API runs to db_statement_timeout_ms.
+
+    LEARNING NOTE:
+    PostgreSQL cancels any single statement running longer than this, so one
+    runaway query can't hold a pooled connection (and a worker thread)
+    forever. Only the API wants that: the import scripts share these engines,
+    and their COPY loads and materialized-view refreshes may legitimately run
+    for minutes. So app/main.py calls this at startup, and scripts (which
+    never import app.main) run without a limit.
+    The SET runs once per new database connection, not per request -
+    except behind an external pooler, where it has to be SET LOCAL in each
+    transaction (see db_external_pooler above).
+    """
+    timeout_ms = int(settings.db_statement_timeout_ms)
+    if not timeout_ms:
+        return
+
+    if settings.db_external_pooler:
+        for db_engine in (engine, read_engine):
+            if db_engine is not None:
+                _on_begin(db_engine, f"SET LOCAL statement_timeout = {timeout_ms}")
+        return
+
+    def set_timeout(dbapi_connection, connection_record):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"SET statement_timeout = {timeout_ms}")
+        # psycopg2 opened a transaction for the SET; commit so it sticks
+        dbapi_connection.commit()
+
+    for db_engine in (engine, read_engine):
+        if db_engine is not None:
+            event.listen(db_engine, "connect", set_timeout)
+
 
 # Create a session factory
 # LEARNING NOTE:
 # - autocommit=False means you control when changes are saved
 # - autoflush=False means SQLAlchemy won't auto-sync with DB
 # - This gives you explicit control (safer for learning)
+# - expire_on_commit=False keeps loaded objects usable after commit(). By
+#   default commit() marks every attribute as stale, and the next access
+#   (e.g. building the response) quietly SELECTs the row again. A session
+#   lives for one request, so the values we just wrote are still correct;
+#   columns the database changes itself (updated_at, trigger-maintained
+#   fields) need RETURNING or an explicit db.refresh(obj, [...]).
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False,
+                 bind=read_engine)
+    if read_engine is not None else None
+)
 
 
 # Base class for all models
@@ -48,6 +168,18 @@ class Base(DeclarativeBase):
     pass
 
 
+# Column defaults computed by PostgreSQL instead of Python
+# LEARNING NOTE:
+# server_default values are filled in by the database on INSERT, so they also
+# apply to rows written without the ORM (COPY loads, raw SQL, migrations).
+# - UTC_NOW: "now, in UTC" as a naive timestamp (same values datetime.utcnow
+#   gives), for created_at/updated_at columns
+# - GEN_RANDOM_UUID: fallback id for non-ORM inserts; the ORM itself fills
+#   in time-ordered UUIDv7 ids (app/models/ids.py)
+UTC_NOW = text("timezone('utc', now())")
+GEN_RANDOM_UUID = text("gen_random_uuid()")
+
+
 def get_db():
     """
     Dependency that provides a database session.
@@ -71,3 +203,25 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db(db=Depends(get_db)):
+    """
+    Dependency that provides a session for read-only endpoints.
+
+    LEARNING NOTE:
+    If DATABASE_READ_URL points at a read replica, the session reads from
+    there, which takes load off the primary database that handles all the
+    writes. Replicas can lag a moment behind, so only use this where
+    slightly old data is fine, and never write through it.
+    Without a replica this is simply the request's normal session (get_db),
+    so no second connection is opened.
+    """
+    if ReadSessionLocal is None:
+        yield db
+        return
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        read_db.close()
@@ -17,6 +17,7 @@ TUTORIAL: https://fastapi.tiangolo.com/tutorial/dependencies/
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -33,7 +34,31 @@ security = HTTPBearer(
 )
 
 
-async def get_current_user_optional(
+def get_configured_auth_service(
+    auth_service: AuthService = Depends(get_auth_service),
+) -> AuthService:
+    """
+    The auth service, or 500 if Supabase isn't set up.
+
+    LEARNING NOTE:
+    Endpoints that call Supabase (login, register, ...) depend on this instead
+    of repeating the same "is it configured?" check in every handler. Whether
+    Supabase is configured is logged once at startup (see app/main.py).
+    """
+    if not auth_service.is_configured():
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Authentication service not configured. Add Supabase credentials to .env",
+        )
+    return auth_service
+
+
+# LEARNING NOTE:
+# get_current_user_optional and get_current_user talk to the database through
+# the synchronous Session, so they are plain `def` functions. FastAPI runs sync
+# dependencies in its threadpool; an `async def` here would run the blocking
+# query directly on the event loop and stall every other in-flight request.
+def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     auth_service: AuthService = Depends(get_auth_service),
     db: Session = Depends(get_db),
@@ -58,13 +83,15 @@ async def get_current_user_optional(
     if not token_data:
         return None
 
-    # Get or create user in our database
-    user = db.query(User).filter(User.id == token_data["user_id"]).first()
+    # Look up the user in our database
+    # LEARNING NOTE: db.get() is a primary-key lookup that checks the session's
+    # identity map first, so repeated lookups in one request are free
+    user = db.get(User, token_data["user_id"])
 
     return user
 
 
-async def get_current_user(
+def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     auth_service: AuthService = Depends(get_auth_service),
     db: Session = Depends(get_db),
@@ -105,23 +132,33 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from our database
-    user = db.query(User).filter(User.id == token_data["user_id"]).first()
+    # Get user from our database (primary-key lookup, see above)
+    user = db.get(User, token_data["user_id"])
 
     if not user:
         # User exists in Supabase but not in our DB yet
         # This happens on first login - we need to create the user
         # For now, we'll create a minimal user record
         # The frontend should call a "complete profile" endpoint to add gender
-        user = User(
-            id=token_data["user_id"],
-            email=token_data["email"],
-            gender=Gender.MALE,  # Default, user should update this
-            current_level=1,
+        #
+        # LEARNING NOTE:
+        # The first screen after login often fires several requests at once,
+        # and all of them land here. A plain INSERT would make all but one fail
+        # with a duplicate-key error; ON CONFLICT DO NOTHING lets the losers
+        # skip the insert and simply load the row the winner created.
+        stmt = (
+            pg_insert(User)
+            .values(
+                id=token_data["user_id"],
+                email=token_data["email"],
+                gender=Gender.MALE,  # Default, user should update this
+                current_level=1,
+            )
+            .on_conflict_do_nothing(index_elements=[User.id])
         )
-        db.add(user)
+        db.execute(stmt)
         db.commit()
-        db.refresh(user)
+        user = db.get(User, token_data["user_id"])
 
     return user
 
@@ -0,0 +1,68 @@
+"""
+HTTP caching helpers (ETag / Cache-Control)
+
+LEARNING NOTE:
+Meal plans and the category list are read all the time and almost never
+change. Two standard HTTP headers let clients skip most of that work:
+
+- ETag: a short fingerprint of the response. The browser remembers it and
+  sends it back as `If-None-Match`. If the fingerprint still matches, we
+  answer 304 Not Modified with an empty body and the browser reuses its copy.
+- Cache-Control: public, max-age=300: any cache in between (the browser, a
+  CDN, Nginx) may reuse the response for 5 minutes without asking us at all.
+
+Only use this for responses that are the same for every user - "public"
+means shared caches may hand them to anyone.
+
+TUTORIAL: https://developer.mozilla.org/en-US/docs/Web/HTTP/Caching
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+CACHE_MAX_AGE = 300  # seconds
+
+
+def make_etag(*parts: Any) -> str:
+    """Fingerprint of `parts` (e.g. ids and updated_at values), quoted as HTTP expects."""
+    raw = ":".join(str(part) for part in parts).encode()
+    return '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+
+
+def cached_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    max_age: int = CACHE_MAX_AGE,
+) -> Optional[Response]:
+    """
+    Set the caching headers; return a 304 response if the client is up to date.
+
+    Set any other response headers (e.g. the pagination cursor) first, so
+    they are sent with the 304 as well.
+
+    Usage in a handler:
+        not_modified = cached_response(request, response, etag)
+        if not_modified is not None:
+            return not_modified
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    # If-None-Match may list several ETags, and caches may weaken them (W/"...")
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_etags or "*" in client_etags:
+        # Headers the handler already set (e.g. X-Next-Cursor) belong on the
+        # 304 too - the client keeps its cached body but still needs them
+        carried = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in ("content-length", "content-type")
+        }
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={**carried, **headers},
+        )
+    response.headers.update(headers)
+    return None
@@ -13,29 +13,83 @@ Run with: uvicorn app.main:app --reload
 TUTORIAL: https://fastapi.tiangolo.com/tutorial/first-steps/
 """
 
+import logging
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
+from app.database import apply_statement_timeout
+from app.services.auth_service import get_auth_service
+from app.services.stripe_service import get_stripe_service
 from app.routers import meal_plans_router
 from app.routers.auth import router as auth_router
 from app.routers.users import router as users_router
 from app.routers.progress import router as progress_router
 from app.routers.subscriptions import router as subscriptions_router
 from app.routers.products import router as products_router
+from app.routers.batch import router as batch_router
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Per-statement time limit for the API's database connections (not scripts)
+apply_statement_timeout()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Code that runs once when the server starts (before yield) and stops.
+
+    LEARNING NOTE:
+    Routes and dependencies that use the database are plain `def`, so
+    FastAPI runs each one in a worker thread. That threadpool defaults to
+    40 threads, which would cap concurrent requests well below the
+    database pool (db_pool_size + db_max_overflow connections). Raising it
+    lets the connection pool actually be used.
+
+    Missing Supabase credentials are reported here, once, rather than on
+    every auth request. In production that's a deployment mistake, so the
+    server refuses to start; in development the app still runs without
+    login (auth endpoints answer 500, see get_configured_auth_service).
+    The same goes for SUPABASE_JWT_SECRET: without it every token signed
+    with the shared secret (HS256) is rejected with a bare 401.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_size
+
+    if not get_auth_service().is_configured():
+        if settings.environment == "production":
+            raise RuntimeError("Supabase credentials missing (SUPABASE_URL / SUPABASE_ANON_KEY)")
+        logger.warning("Supabase not configured - authentication is disabled")
+    elif not get_auth_service().can_verify_hs256():
+        if settings.environment == "production":
+            raise RuntimeError("SUPABASE_JWT_SECRET missing - HS256 access tokens can't be verified")
+        logger.warning("SUPABASE_JWT_SECRET not set - HS256 access tokens will be rejected (401)")
+    yield
+    # Shutdown: close the shared services' pooled connections
+    get_auth_service().close()
+    await get_stripe_service().close()
 
 # Create the FastAPI app
 # LEARNING NOTE:
 # - title/description/version appear in the auto-generated docs at /docs
 # - This metadata helps anyone using your API understand what it does
+# - default_response_class=ORJSONResponse: responses are turned into JSON
+#   text by orjson (written in Rust) instead of Python's json module -
+#   noticeably faster for big lists like /products or a year of weight history
 app = FastAPI(
     title="Sloth API",
     description="Backend API for the Sloth meal planning SaaS (Faultierdiät)",
     version="0.1.0",
     docs_url="/docs",      # Swagger UI at /docs
     redoc_url="/redoc",    # ReDoc at /redoc
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS (Cross-Origin Resource Sharing)
@@ -56,8 +110,16 @@ app.add_middleware(
         "https://frontend-h5h96zizq-stephans-projects-141dc3ab.vercel.app",  # Vercel preview
     ],
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods
-    allow_headers=["*"],  # Allow all headers
+    # LEARNING NOTE:
+    # Explicit lists (instead of "*") give browsers a stable answer to the
+    # preflight OPTIONS request, and max_age lets them cache that answer for
+    # a day instead of sending a preflight before every cross-origin call.
+    # The frontend only sends Authorization (Bearer token) and Content-Type.
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    # Response headers the frontend's JavaScript may read
+    expose_headers=["X-Next-Cursor", "ETag"],
+    max_age=86400,  # seconds (24 hours)
 )
 
 # Include routers
@@ -70,6 +132,7 @@ app.include_router(meal_plans_router)  # Meal plan endpoints: /meal-plans/*
 app.include_router(progress_router)  # Weight tracking endpoints: /weight/*
 app.include_router(subscriptions_router)  # Subscription endpoints: /subscriptions/*
 app.include_router(products_router)  # Product catalog endpoints: /products/*
+app.include_router(batch_router)  # Several GETs in one request: /batch
 
 
 @app.get("/", tags=["Health"])
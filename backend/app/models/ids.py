@@ -0,0 +1,42 @@
+"""
+Primary Key Helpers
+
+LEARNING NOTE:
+Random UUIDs (uuid4) scatter new rows all over the primary-key index, so
+every insert touches a different B-tree page. A UUIDv7 starts with a
+millisecond timestamp, so ids created one after another sort next to each
+other and inserts keep hitting the same "hot" right-hand edge of the index.
+It is still a normal 128-bit UUID, so it fits PostgreSQL's uuid type as-is.
+
+Python 3.14 ships uuid.uuid7(); until then this small helper builds one
+following RFC 9562.
+
+TUTORIAL: https://www.rfc-editor.org/rfc/rfc9562#name-uuid-version-7
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Return a new time-ordered UUID (version 7).
+
+    Layout: 48 bits of Unix time in milliseconds, then the version/variant
+    bits, with the remaining 74 bits random.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                         # version 7
+    value |= ((rand >> 62) & 0xFFF) << 64      # rand_a (12 bits)
+    value |= 0b10 << 62                        # RFC 9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF      # rand_b (62 bits)
+    return uuid.UUID(int=value)
+
+
+def uuid7_str() -> str:
+    """uuid7() as a string - the form our models use for ids."""
+    return str(uuid7())
@@ -11,13 +11,12 @@ This is the core of your brother's diet system - the 100 pre-built day plans.
 TUTORIAL: https://docs.sqlalchemy.org/en/20/tutorial/orm_related_objects.html
 """
 
-import uuid
 from datetime import datetime
-from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Text
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Text, Index, text
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
-from app.models.user import Gender
+from app.database import Base, UTC_NOW
+from app.models.user import Gender, gender_enum
 import enum
 from typing import TYPE_CHECKING
 
@@ -33,6 +32,10 @@ class MealType(str, enum.Enum):
     SNACK = "snack"
 
 
+# Shared "mealtype" ENUM (see gender_enum in app/models/user.py)
+meal_type_enum = ENUM(MealType, name="mealtype", create_type=False)
+
+
 class MealPlan(Base):
     """
     A single day's meal plan.
@@ -45,10 +48,27 @@ class MealPlan(Base):
     """
     __tablename__ = "meal_plans"
 
+    # LEARNING NOTE:
+    # (gender, level, day_number) is how plans are looked up and listed, and
+    # there is exactly one plan per combination. The unique index serves those
+    # queries (including ORDER BY level, day_number within a gender) and stops
+    # a re-run of the import script from seeding duplicate plans.
+    __table_args__ = (
+        Index(
+            "ix_meal_plans_gender_level_day",
+            "gender", "level", "day_number",
+            unique=True,
+        ),
+    )
+
+    # LEARNING NOTE:
+    # UUID(as_uuid=False) stores ids as PostgreSQL's native 16-byte uuid type
+    # but keeps handing them to Python as plain strings, so schemas and routes
+    # don't change. gen_random_uuid() lets the database fill in new ids.
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        server_default=text("gen_random_uuid()")
     )
 
     # Which level this plan belongs to (1-5)
@@ -58,7 +78,7 @@ class MealPlan(Base):
     day_number: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Which gender this plan is for
-    gender: Mapped[Gender] = mapped_column(SQLEnum(Gender), nullable=False)
+    gender: Mapped[Gender] = mapped_column(gender_enum, nullable=False)
 
     # Daily totals (pre-calculated for display)
     total_kcal: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -71,14 +91,24 @@ class MealPlan(Base):
     description: Mapped[str] = mapped_column(Text, nullable=True)
 
     # Full file path to the PDF for this meal plan
-    pdf_path: Mapped[str] = mapped_column(String(500), nullable=True)
+    # LEARNING NOTE:
+    # Text has no length cap and is stored like varchar in PostgreSQL (long
+    # values get moved out of line by TOAST). deferred=True leaves the column
+    # out of the normal SELECT - no API response uses it - so loading plans
+    # doesn't drag the path along; it is fetched only if plan.pdf_path is read.
+    pdf_path: Mapped[str] = mapped_column(Text, nullable=True, deferred=True)
 
     # Timestamps
+    # LEARNING NOTE:
+    # These are filled in by PostgreSQL rather than by datetime.utcnow in
+    # Python, so a bulk insert doesn't need a Python-computed literal per row.
+    # timezone('utc', now()) keeps the same naive-UTC values utcnow produced.
+    # onupdate with a SQL expression renders it inline in the UPDATE statement.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
 
     # RELATIONSHIP: One MealPlan has many Meals
@@ -86,10 +116,14 @@ class MealPlan(Base):
     # - relationship() creates a convenient way to access related objects
     # - back_populates creates a two-way link (meal.meal_plan also works)
     # - cascade="all, delete-orphan" means deleting a plan deletes its meals
+    # - passive_deletes=True leaves that delete to the database: the foreign
+    #   keys are ON DELETE CASCADE, so SQLAlchemy doesn't need to load every
+    #   child row and DELETE them one by one first (used on every cascade)
     meals: Mapped[list["Meal"]] = relationship(
         "Meal",
         back_populates="meal_plan",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -105,21 +139,24 @@ class Meal(Base):
     __tablename__ = "meals"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        server_default=text("gen_random_uuid()")
     )
 
     # Which meal plan this belongs to
-    # LEARNING NOTE: ForeignKey creates the database-level relationship
+    # LEARNING NOTE: ForeignKey creates the database-level relationship.
+    # PostgreSQL does NOT index foreign keys automatically, so index=True keeps
+    # loading a plan's meals (and cascading deletes) from scanning the table.
     meal_plan_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("meal_plans.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     # Type of meal
-    meal_type: Mapped[MealType] = mapped_column(SQLEnum(MealType), nullable=False)
+    meal_type: Mapped[MealType] = mapped_column(meal_type_enum, nullable=False)
 
     # Order for display (allows multiple snacks)
     order_index: Mapped[int] = mapped_column(Integer, default=0)
@@ -134,11 +171,17 @@ class Meal(Base):
     total_fat: Mapped[float] = mapped_column(Float, default=0)
 
     # RELATIONSHIPS
+    # LEARNING NOTE:
+    # A meal is never shown without its ingredients, so lazy="selectin" loads
+    # the ingredients of ALL meals in one "WHERE meal_id IN (...)" query as soon
+    # as the meals are loaded, instead of one query per meal (the N+1 problem).
     meal_plan: Mapped["MealPlan"] = relationship("MealPlan", back_populates="meals")
     ingredients: Mapped[list["Ingredient"]] = relationship(
         "Ingredient",
         back_populates="meal",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin"
     )
 
     def __repr__(self) -> str:
@@ -159,16 +202,17 @@ class Ingredient(Base):
     __tablename__ = "ingredients"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        server_default=text("gen_random_uuid()")
     )
 
     # Which meal this belongs to
     meal_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("meals.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     # Product details
@@ -187,14 +231,39 @@ class Ingredient(Base):
 
     # Optional link to the products catalog
     product_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("products.id"),
         nullable=True,
+        index=True,
     )
 
     # RELATIONSHIPS
     meal: Mapped["Meal"] = relationship("Meal", back_populates="ingredients")
     product: Mapped["Product"] = relationship("Product", back_populates="ingredients")
 
+    # Units whose quantity is a weight/volume we can scale per-100g values by
+    WEIGHED_UNITS = ("g", "ml")
+
+    def copy_nutrition_from(self, product: "Product") -> bool:
+        """
+        Copy macros from the linked catalog product onto this ingredient.
+
+        LEARNING NOTE:
+        kcal/protein/carbs/fat are deliberately stored on the ingredient row
+        (denormalized) so showing a meal plan never has to join products.
+        This fills them from the product's per-100g values, scaled to this
+        ingredient's quantity. Only g/ml quantities can be scaled; returns
+        False (and changes nothing) otherwise or if the product has no data.
+        """
+        if self.unit not in self.WEIGHED_UNITS or product.calories_per_100g is None:
+            return False
+
+        factor = self.quantity / 100
+        self.kcal = round(product.calories_per_100g * factor)
+        self.protein = round((product.protein_per_100g or 0) * factor, 1)
+        self.carbs = round((product.carbs_per_100g or 0) * factor, 1)
+        self.fat = round((product.fat_per_100g or 0) * factor, 1)
+        return True
+
     def __repr__(self) -> str:
         return f"<Ingredient {self.quantity}{self.unit} {self.product_name}>"
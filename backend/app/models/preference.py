@@ -7,12 +7,14 @@ Over time, the app learns to suggest plans the user will enjoy
 and hide the ones they don't like.
 """
 
-import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, ForeignKey, UniqueConstraint
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import (
+    DateTime, ForeignKey, SmallInteger, TypeDecorator, UniqueConstraint, CheckConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, GEN_RANDOM_UUID, UTC_NOW
+from app.models.ids import uuid7_str
 import enum
 
 
@@ -23,6 +25,40 @@ class PreferenceType(str, enum.Enum):
     NEUTRAL = "neutral"
 
 
+# Fixed storage codes - never renumber these, they are what's in the table
+PREFERENCE_CODES = {
+    PreferenceType.LIKED: 1,
+    PreferenceType.DISLIKED: 2,
+    PreferenceType.NEUTRAL: 3,
+}
+
+
+class PreferenceCode(TypeDecorator):
+    """
+    Stores a PreferenceType as a SMALLINT code.
+
+    LEARNING NOTE:
+    user_preferences gets a row per user per meal plan, so it is the one table
+    where a 2-byte SMALLINT instead of a 4-byte ENUM adds up. A TypeDecorator
+    translates at the boundary: Python code keeps using PreferenceType
+    ("liked"), only the database sees 1/2/3.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    _by_code = {code: pref for pref, code in PREFERENCE_CODES.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return PREFERENCE_CODES[PreferenceType(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._by_code[value]
+
+
 class UserPreference(Base):
     """
     User's preference (like/dislike) for a specific meal plan.
@@ -34,44 +70,74 @@ class UserPreference(Base):
     __tablename__ = "user_preferences"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=uuid7_str,
+        server_default=GEN_RANDOM_UUID
     )
 
     user_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
 
     meal_plan_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("meal_plans.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
 
     preference: Mapped[PreferenceType] = mapped_column(
-        SQLEnum(PreferenceType),
+        PreferenceCode,
         nullable=False
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
 
     # CONSTRAINT: One preference per user per meal plan
     __table_args__ = (
         UniqueConstraint('user_id', 'meal_plan_id', name='uq_user_meal_preference'),
+        CheckConstraint('preference IN (1, 2, 3)', name='ck_user_preferences_preference'),
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="preferences")
 
+    @classmethod
+    def upsert(cls, rows: list[dict]):
+        """
+        Build one INSERT ... ON CONFLICT DO UPDATE for a batch of preferences.
+
+        rows: [{"user_id": ..., "meal_plan_id": ..., "preference": ...}, ...]
+
+        LEARNING NOTE:
+        "Set the preference, whether or not one exists yet" would otherwise be
+        a SELECT followed by an INSERT or UPDATE - two round trips, and two
+        concurrent requests could both see "no row" and both INSERT. With
+        ON CONFLICT, PostgreSQL does it atomically in one statement, and many
+        rows (e.g. a batch of swipes) can go in the same statement.
+        `excluded` is the row that failed to insert.
+
+        Usage:
+            db.execute(UserPreference.upsert(rows))
+            db.commit()
+        """
+        stmt = insert(cls).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=["user_id", "meal_plan_id"],
+            set_={
+                "preference": stmt.excluded.preference,
+                "updated_at": UTC_NOW,
+            },
+        )
+
     def __repr__(self) -> str:
         return f"<UserPreference user={self.user_id[:8]} plan={self.meal_plan_id[:8]} {self.preference.value}>"
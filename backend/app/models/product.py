@@ -5,14 +5,38 @@ Product catalog with multi-source data pipeline support.
 Sources: manual (curated), off (Open Food Facts), bls (Bundeslebensmittelschlüssel).
 """
 
-import uuid
 from datetime import datetime, date
 from sqlalchemy import (
     String, Integer, Float, DateTime, Date, ForeignKey, Text,
-    Boolean, Index, CheckConstraint, UniqueConstraint,
+    Boolean, Index, CheckConstraint, UniqueConstraint, Computed, case, literal, text,
 )
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, GEN_RANDOM_UUID, UTC_NOW
+from app.models.ids import uuid7_str
+
+# Every Open Food Facts image lives under this prefix
+OFF_IMAGE_BASE = "https://images.openfoodfacts.org/images/products/"
+
+
+def image_key_from_url(url: str | None) -> str | None:
+    """
+    Shorten an image URL to what Product stores in image_key/image_thumb_key.
+
+    Open Food Facts URLs lose their common prefix (OFF_IMAGE_BASE); any other
+    URL is stored unchanged.
+    """
+    if url and url.startswith(OFF_IMAGE_BASE):
+        return url[len(OFF_IMAGE_BASE):]
+    return url
+
+
+def _image_url_from_key(key: str | None) -> str | None:
+    """Inverse of image_key_from_url()."""
+    if key is None or key.startswith(("http://", "https://")):
+        return key
+    return OFF_IMAGE_BASE + key
 
 
 class Product(Base):
@@ -24,10 +48,15 @@ class Product(Base):
     """
     __tablename__ = "products"
 
+    # LEARNING NOTE:
+    # Ids are time-ordered UUIDv7s (see app/models/ids.py), so bulk imports
+    # append to the end of the primary-key index instead of splitting random
+    # pages all over it.
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid7_str,
+        server_default=GEN_RANDOM_UUID,
     )
 
     # Product identification
@@ -64,18 +93,39 @@ class Product(Base):
 
     # Quality/display fields
     nutriscore_grade: Mapped[str] = mapped_column(String(1), nullable=True)  # a-e
-    image_url: Mapped[str] = mapped_column(String(500), nullable=True)
-    image_thumb_url: Mapped[str] = mapped_column(String(500), nullable=True)
+    # LEARNING NOTE:
+    # Hundreds of thousands of OFF products share the same long image URL
+    # prefix, so only the part after OFF_IMAGE_BASE is stored (~30 bytes
+    # instead of ~100). image_url / image_thumb_url below rebuild the full
+    # URL. Non-OFF images (e.g. for curated products) keep their full URL.
+    image_key: Mapped[str] = mapped_column(Text, nullable=True)
+    image_thumb_key: Mapped[str] = mapped_column(Text, nullable=True)
 
     # Notes
     notes: Mapped[str] = mapped_column(Text, nullable=True)
 
+    # Full-text search document over name + brand
+    # LEARNING NOTE:
+    # A generated ("Computed") column is filled in by PostgreSQL itself on
+    # every INSERT/UPDATE, so it can never drift from name/brand. The 'simple'
+    # config splits words and lower-cases them without language-specific
+    # stemming (product names mix German, English and brand names).
+    # deferred=True: it is only used in WHERE clauses, never sent to clients.
+    search_vec: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(brand, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
     last_synced_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
@@ -84,6 +134,7 @@ class Product(Base):
         "ProductAvailability",
         back_populates="product",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     # Alternatives where this product is the original
     alternatives: Mapped[list["ProductAlternative"]] = relationship(
@@ -91,6 +142,8 @@ class Product(Base):
         back_populates="original_product",
         foreign_keys="ProductAlternative.original_product_id",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="ProductAlternative.priority",
     )
     # Ingredients that link to this product
     ingredients: Mapped[list["Ingredient"]] = relationship(
@@ -102,42 +155,97 @@ class Product(Base):
         "ProductSourceLink",
         back_populates="product",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
         Index("idx_products_data_source", "data_source"),
         Index("idx_products_off_id", "off_id"),
         Index("idx_products_bls_code", "bls_code"),
+        # Serves list_products' ORDER BY and its keyset cursor
+        # (app/pagination.py) without sorting the catalog per page
+        Index("ix_products_category_name_id", "category", "name", "id"),
+        # GIN indexes every word of search_vec, so "@@" matches are index
+        # lookups instead of a scan of the whole catalog
+        Index("products_search_gin", "search_vec", postgresql_using="gin"),
+        # LEARNING NOTE: A partial index only contains rows matching its WHERE.
+        # Most imported products have no barcode, so this stays small, and
+        # being UNIQUE it doubles as the "one product per EAN" guard for the
+        # import pipeline (NULLs are left out, so they never clash).
+        Index(
+            "uq_products_ean",
+            "ean",
+            unique=True,
+            postgresql_where=text("ean IS NOT NULL"),
+        ),
     )
 
+    # Full image URLs, rebuilt from the stored keys (usable in queries too)
+    @hybrid_property
+    def image_url(self) -> str | None:
+        return _image_url_from_key(self.image_key)
+
+    @image_url.inplace.setter
+    def _image_url_setter(self, url: str | None) -> None:
+        self.image_key = image_key_from_url(url)
+
+    @image_url.inplace.expression
+    @classmethod
+    def _image_url_expression(cls):
+        return _image_url_sql(cls.image_key)
+
+    @hybrid_property
+    def image_thumb_url(self) -> str | None:
+        return _image_url_from_key(self.image_thumb_key)
+
+    @image_thumb_url.inplace.setter
+    def _image_thumb_url_setter(self, url: str | None) -> None:
+        self.image_thumb_key = image_key_from_url(url)
+
+    @image_thumb_url.inplace.expression
+    @classmethod
+    def _image_thumb_url_expression(cls):
+        return _image_url_sql(cls.image_thumb_key)
+
     def __repr__(self) -> str:
         return f"<Product {self.name} ({self.brand}) src={self.data_source}>"
 
 
+def _image_url_sql(key_column):
+    """SQL version of _image_url_from_key() for the hybrid properties."""
+    return case(
+        (key_column.like("http://%") | key_column.like("https://%"), key_column),
+        else_=literal(OFF_IMAGE_BASE) + key_column,
+    )
+
+
 class ProductAvailability(Base):
     """Which supermarket chains carry which products."""
     __tablename__ = "product_availability"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid7_str,
+        server_default=GEN_RANDOM_UUID,
     )
 
     product_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
     )
     store_chain: Mapped[str] = mapped_column(String(100), nullable=False)
     is_available: Mapped[bool] = mapped_column(Boolean, default=True)
-    last_verified: Mapped[date] = mapped_column(Date, default=date.today, nullable=True)
+    last_verified: Mapped[date] = mapped_column(
+        Date, server_default=text("CURRENT_DATE"), nullable=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
 
     # Relationships
@@ -156,18 +264,19 @@ class ProductAlternative(Base):
     __tablename__ = "product_alternatives"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid7_str,
+        server_default=GEN_RANDOM_UUID,
     )
 
     original_product_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
     )
     alternative_product_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -176,7 +285,7 @@ class ProductAlternative(Base):
     priority: Mapped[int] = mapped_column(Integer, default=1)  # 1 = best
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
 
     # Relationships
@@ -195,6 +304,17 @@ class ProductAlternative(Base):
             "original_product_id != alternative_product_id",
             name="ck_different_products",
         ),
+        # LEARNING NOTE: A "covering" index. Substitution lookups filter on
+        # original_product_id and sort by priority (the key columns); INCLUDE
+        # stores the other columns they read in the index leaf too, so
+        # PostgreSQL can answer from the index alone ("index-only scan")
+        # without visiting the table rows.
+        Index(
+            "ix_alt_covering",
+            "original_product_id",
+            "priority",
+            postgresql_include=["alternative_product_id", "reason"],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -206,21 +326,26 @@ class ProductSourceLink(Base):
     __tablename__ = "product_source_links"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid7_str,
+        server_default=GEN_RANDOM_UUID,
     )
 
     product_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
     )
     source: Mapped[str] = mapped_column(String(50), nullable=False)  # "off", "bls"
     external_id: Mapped[str] = mapped_column(String(100), nullable=False)
-    external_data: Mapped[str] = mapped_column(Text, nullable=True)  # raw JSON snapshot
+    # Raw JSON snapshot from the source.
+    # LEARNING NOTE: JSONB stores the JSON already parsed (binary), so reading
+    # it back needs no json.loads() and PostgreSQL can filter on keys directly,
+    # e.g. external_data->>'code'. It comes back in Python as a dict.
+    external_data: Mapped[dict] = mapped_column(JSONB, nullable=True)
     matched_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
     match_method: Mapped[str] = mapped_column(String(50), nullable=True)  # "ean_exact", "fuzzy_name"
     match_confidence: Mapped[float] = mapped_column(Float, nullable=True)
@@ -7,11 +7,12 @@ The Faultierdiät uses weight stalls (2+ weeks no progress) to signal
 when to drop to the next level.
 """
 
-import uuid
 from datetime import datetime, date
-from sqlalchemy import String, Float, DateTime, Date, ForeignKey, Text
+from sqlalchemy import Float, DateTime, Date, ForeignKey, Index, Text, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, GEN_RANDOM_UUID, UTC_NOW
+from app.models.ids import uuid7_str
 
 
 class WeightEntry(Base):
@@ -27,17 +28,18 @@ class WeightEntry(Base):
     __tablename__ = "weight_entries"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=uuid7_str,
+        server_default=GEN_RANDOM_UUID
     )
 
     # Which user this belongs to
+    # (indexed together with measured_at, see __table_args__ below)
     user_id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True  # Index for fast user lookups
     )
 
     # The weight in kg
@@ -52,11 +54,37 @@ class WeightEntry(Base):
 
     # When this record was created in our system
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, nullable=False
     )
 
     # Relationship back to user
     user: Mapped["User"] = relationship("User", back_populates="weight_entries")
 
+    # LEARNING NOTE:
+    # Every progress query is "this user's entries, by date" (latest entry,
+    # history graph, stall detection). A composite index on
+    # (user_id, measured_at DESC) hands those rows back already sorted, so
+    # PostgreSQL can stop after the first row for "latest" instead of sorting.
+    # It also serves plain user_id lookups, so no separate user_id index.
+    # Being UNIQUE, it also enforces "one entry per user per day" in the
+    # database itself, so the API doesn't need a check-then-insert query.
+    # The table is marked to CLUSTER on this index (migration f6c8e0a2b4d7):
+    # running `CLUSTER weight_entries;` now and then stores each user's
+    # entries next to each other on disk, so a 14/90-day window reads a
+    # handful of pages.
+    # INCLUDE (weight_kg) stores the weight in the index too (it isn't part
+    # of the key, so uniqueness is unchanged). Stall detection only needs
+    # dates and weights, so it's answered from the index alone ("index-only
+    # scan") without visiting the table (migration d4f6a8c0e2b5).
+    __table_args__ = (
+        Index(
+            "uq_weight_entries_user_measured_weight",
+            "user_id",
+            text("measured_at DESC"),
+            unique=True,
+            postgresql_include=["weight_kg"],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<WeightEntry {self.weight_kg}kg on {self.measured_at}>"
@@ -13,13 +13,16 @@ This defines the 'users' table in your database. Key concepts:
 TUTORIAL: https://docs.sqlalchemy.org/en/20/tutorial/metadata.html
 """
 
-import uuid
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Float, DateTime, Boolean, Text
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import (
+    String, Integer, Float, DateTime, Boolean, Text, Index, Numeric,
+    and_, case, cast, func, text,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.dialects.postgresql import ARRAY, ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, UTC_NOW
 import enum
 
 
@@ -50,6 +53,17 @@ class ActivityLevel(str, enum.Enum):
     ACTIVE = "active"
 
 
+# LEARNING NOTE:
+# Shared PostgreSQL ENUM types. Each database type is defined once here and
+# reused by every column that stores it (meal_plans.gender uses gender_enum
+# too). create_type=False leaves CREATE TYPE / DROP TYPE to Alembic, so
+# metadata.create_all() and autogenerate never try to recreate a type that
+# already exists. The labels are the member NAMES ('MALE', 'SEDENTARY'),
+# which is what the existing types were created with.
+gender_enum = ENUM(Gender, name="gender", create_type=False)
+activity_level_enum = ENUM(ActivityLevel, name="activitylevel", create_type=False)
+
+
 class User(Base):
     """
     User account model.
@@ -66,11 +80,11 @@ class User(Base):
     # Core Fields (from Supabase Auth)
     # ===========================================================================
 
-    # Primary key - matches Supabase Auth user ID
+    # Primary key - matches Supabase Auth user ID (a native PostgreSQL uuid)
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        server_default=text("gen_random_uuid()")
     )
 
     # User email - must be unique, indexed for fast lookups
@@ -87,7 +101,7 @@ class User(Base):
 
     # Gender determines which meal plans to show (men vs women)
     gender: Mapped[Optional[Gender]] = mapped_column(
-        SQLEnum(Gender),
+        gender_enum,
         nullable=True  # Nullable until intake form completed
     )
 
@@ -103,6 +117,9 @@ class User(Base):
     )
 
     # Weight tracking
+    # current_weight_kg is set from the intake form, then kept equal to the
+    # latest weight entry by a database trigger on weight_entries
+    # (migration f5b7d9e1a3c6) - routes don't need to maintain it.
     current_weight_kg: Mapped[Optional[float]] = mapped_column(
         Float,
         nullable=True
@@ -114,7 +131,8 @@ class User(Base):
     )
 
     # Starting weight - captured at intake, never changes
-    # Useful for showing total progress
+    # Useful for showing total progress. If intake skipped it, the first
+    # weight entry fills it in (same weight_entries trigger as above).
     starting_weight_kg: Mapped[Optional[float]] = mapped_column(
         Float,
         nullable=True
@@ -122,7 +140,7 @@ class User(Base):
 
     # Activity level for calorie calculations
     activity_level: Mapped[Optional[ActivityLevel]] = mapped_column(
-        SQLEnum(ActivityLevel),
+        activity_level_enum,
         nullable=True
     )
 
@@ -138,11 +156,14 @@ class User(Base):
         nullable=False
     )
 
-    # Dietary restrictions - stored as comma-separated values
-    # e.g., "vegetarian,gluten-free"
-    # LEARNING NOTE: For MVP, simple string. Later could be a separate table.
-    dietary_restrictions: Mapped[Optional[str]] = mapped_column(
-        Text,
+    # Dietary restrictions - stored as a PostgreSQL text[] array
+    # e.g., ["vegetarian", "gluten-free"]
+    # LEARNING NOTE: An array column comes back as a Python list (no splitting
+    # strings), and with the GIN index below the database can answer
+    # "who is vegetarian?" itself:
+    #     User.dietary_restrictions.contains(["vegetarian"])
+    dietary_restrictions: Mapped[Optional[list[str]]] = mapped_column(
+        ARRAY(Text),
         nullable=True
     )
 
@@ -169,10 +190,10 @@ class User(Base):
     # ===========================================================================
 
     # Stripe customer ID - linked after first purchase
+    # (unique index in __table_args__: webhooks find the user by it)
     stripe_customer_id: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
-        index=True
     )
 
     # Subscription status for quick checks (updated by webhooks)
@@ -194,14 +215,14 @@ class User(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=UTC_NOW,
         nullable=False
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW,
+        onupdate=UTC_NOW,
         nullable=False
     )
 
@@ -213,35 +234,73 @@ class User(Base):
     weight_entries: Mapped[list["WeightEntry"]] = relationship(
         "WeightEntry",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     # One user has many preferences
     preferences: Mapped[list["UserPreference"]] = relationship(
         "UserPreference",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # GIN indexes index each array ELEMENT, so "contains" filters on
+    # dietary_restrictions don't have to scan every user
+    #
+    # A Stripe customer belongs to exactly one user. The UNIQUE index makes
+    # the database guarantee that, so a webhook's
+    # UPDATE ... WHERE stripe_customer_id = ... can only ever touch one row.
+    # Users without a customer id (NULL) are left out of the index.
+    __table_args__ = (
+        Index("ix_users_dietary_restrictions", "dietary_restrictions", postgresql_using="gin"),
+        Index(
+            "uq_users_stripe_customer_id",
+            "stripe_customer_id",
+            unique=True,
+            postgresql_where=text("stripe_customer_id IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
         """String representation for debugging"""
         return f"<User {self.email} level={self.current_level}>"
 
-    @property
+    # LEARNING NOTE:
+    # These are hybrid properties: on an instance (user.bmi) they run as plain
+    # Python, but used on the class (User.bmi) they turn into a SQL expression,
+    # so the database can filter and sort on them without loading any rows:
+    #     db.query(User).filter(User.bmi > 30)
+    # PostgreSQL only has round(numeric, int), hence the casts to Numeric.
+
+    @hybrid_property
     def bmi(self) -> Optional[float]:
         """
         Calculate BMI if we have height and weight.
 
         LEARNING NOTE:
         BMI = weight(kg) / height(m)²
-        This is a @property - it's calculated on the fly, not stored in DB.
+        It's calculated on the fly, not stored in DB.
         """
         if self.current_weight_kg and self.height_cm:
             height_m = self.height_cm / 100
             return round(self.current_weight_kg / (height_m ** 2), 1)
         return None
 
-    @property
+    @bmi.inplace.expression
+    @classmethod
+    def _bmi_expression(cls):
+        height_m = cls.height_cm / 100.0
+        return case(
+            (
+                and_(cls.current_weight_kg > 0, cls.height_cm > 0),
+                func.round(cast(cls.current_weight_kg / (height_m * height_m), Numeric), 1),
+            ),
+            else_=None,
+        )
+
+    @hybrid_property
     def weight_to_lose(self) -> Optional[float]:
         """How much weight left to lose to reach goal"""
         if self.current_weight_kg and self.goal_weight_kg:
@@ -249,10 +308,34 @@ class User(Base):
             return round(diff, 1) if diff > 0 else 0
         return None
 
-    @property
+    @weight_to_lose.inplace.expression
+    @classmethod
+    def _weight_to_lose_expression(cls):
+        diff = cls.current_weight_kg - cls.goal_weight_kg
+        return case(
+            (
+                and_(cls.current_weight_kg > 0, cls.goal_weight_kg > 0),
+                func.round(cast(func.greatest(diff, 0), Numeric), 1),
+            ),
+            else_=None,
+        )
+
+    @hybrid_property
     def total_weight_lost(self) -> Optional[float]:
         """Total weight lost since starting"""
         if self.starting_weight_kg and self.current_weight_kg:
             diff = self.starting_weight_kg - self.current_weight_kg
             return round(diff, 1) if diff > 0 else 0
         return None
+
+    @total_weight_lost.inplace.expression
+    @classmethod
+    def _total_weight_lost_expression(cls):
+        diff = cls.starting_weight_kg - cls.current_weight_kg
+        return case(
+            (
+                and_(cls.starting_weight_kg > 0, cls.current_weight_kg > 0),
+                func.round(cast(func.greatest(diff, 0), Numeric), 1),
+            ),
+            else_=None,
+        )
@@ -0,0 +1,103 @@
+"""
+Keyset ("cursor") pagination helpers
+
+LEARNING NOTE:
+OFFSET pagination (?skip=10000&limit=100) makes PostgreSQL produce and throw
+away 10000 rows before it returns the 100 you asked for - deeper pages get
+slower and slower. Keyset pagination remembers where the last page ended
+(the sort-key values of its last row) and asks for rows AFTER that:
+
+    WHERE (category, name, id) > ('Dairy', 'Quark', '0190...')
+    ORDER BY category, name, id
+    LIMIT 100
+
+With an index on the sort keys every page costs the same, however deep.
+The sort keys must be unique together, so the id is always the last one.
+
+The position is handed to the client as an opaque string (the "cursor") in
+the X-Next-Cursor response header; it sends it back as ?cursor=... to get
+the next page. List bodies stay plain JSON arrays.
+
+TUTORIAL: https://use-the-index-luke.com/no-offset
+"""
+
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Uuid, literal, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Turn the sort-key values of a row into an opaque cursor string."""
+    raw = json.dumps([
+        v if v is None or isinstance(v, (int, float)) else str(v) for v in values
+    ])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _cursor_value(column, value: Any) -> Any:
+    """Convert one decoded cursor value to its column's Python type (ValueError if it can't be)."""
+    # Sort keys are NOT NULL columns; a row comparison with NULL matches nothing
+    if value is None:
+        raise ValueError("null sort key")
+    if isinstance(column.type, Uuid):
+        parsed = uuid.UUID(value) if isinstance(value, str) else None
+        if parsed is None:
+            raise ValueError("not a uuid")
+        return parsed if column.type.as_uuid else str(parsed)
+    python_type = column.type.python_type
+    if python_type in (datetime, date) and isinstance(value, str):
+        return python_type.fromisoformat(value)
+    if python_type is float and type(value) is int:
+        return float(value)
+    # type() rather than isinstance(): True must not pass as an int
+    if type(value) is not python_type:
+        raise ValueError(f"expected {python_type.__name__}")
+    return value
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list[Any]:
+    """
+    Inverse of encode_cursor(); a malformed cursor is a 400.
+
+    LEARNING NOTE:
+    The cursor comes from the client, so it is checked like any other input:
+    one value per sort column, each of that column's type. Otherwise a
+    tampered cursor (say "abc" where a UUID belongs) would only fail inside
+    PostgreSQL, as a 500.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("wrong number of values")
+        return [_cursor_value(c, v) for c, v in zip(columns, values)]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def apply_cursor(query, columns: Sequence, cursor: Optional[str]):
+    """ORDER BY `columns` and, if a cursor is given, continue after it."""
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        # literal(type_=...) binds each value with its column's type (uuid, ...)
+        bound = [literal(v, type_=c.type) for c, v in zip(columns, values)]
+        query = query.filter(tuple_(*columns) > tuple_(*bound))
+    return query.order_by(*columns)
+
+
+def set_next_cursor(response: Response, rows: list, columns: Sequence, limit: int) -> None:
+    """Put the cursor for the page after `rows` in the response headers."""
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, column.key) for column in columns]
+        )
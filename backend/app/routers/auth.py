@@ -16,6 +16,9 @@ TUTORIAL: https://fastapi.tiangolo.com/tutorial/security/
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.security import HTTPAuthorizationCredentials
+from typing import Optional
+from app.dependencies import security, get_configured_auth_service
 from app.services.auth_service import AuthService, get_auth_service
 from app.schemas.auth import (
     EmailPasswordRequest,
@@ -47,7 +50,7 @@ router = APIRouter(
 )
 async def register(
     credentials: EmailPasswordRequest,
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AuthService = Depends(get_configured_auth_service),
 ):
     """
     Register a new user with email and password.
@@ -63,12 +66,6 @@ async def register(
     3. If no confirmation needed, returns tokens immediately
     4. Frontend stores tokens for authenticated requests
     """
-    if not auth_service.is_configured():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service not configured. Add Supabase credentials to .env"
-        )
-
     try:
         result = await auth_service.sign_up_with_email(
             email=credentials.email,
@@ -97,7 +94,7 @@ async def register(
 )
 async def login(
     credentials: EmailPasswordRequest,
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AuthService = Depends(get_configured_auth_service),
 ):
     """
     Sign in with email and password.
@@ -111,12 +108,6 @@ async def login(
     **Security tip:** Store tokens in httpOnly cookies or secure storage,
     not in localStorage (vulnerable to XSS attacks).
     """
-    if not auth_service.is_configured():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service not configured"
-        )
-
     try:
         result = await auth_service.sign_in_with_email(
             email=credentials.email,
@@ -143,7 +134,7 @@ async def login(
 )
 async def refresh_token(
     request: RefreshTokenRequest,
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AuthService = Depends(get_configured_auth_service),
 ):
     """
     Get a new access token using refresh token.
@@ -156,12 +147,6 @@ async def refresh_token(
     - Access token expired (401 response from API)
     - Proactively before expiration (check expires_at timestamp)
     """
-    if not auth_service.is_configured():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service not configured"
-        )
-
     try:
         result = await auth_service.refresh_session(request.refresh_token)
         return TokenRefreshResponse(**result)
@@ -179,7 +164,7 @@ async def refresh_token(
 )
 async def google_oauth(
     request: GoogleOAuthRequest,
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AuthService = Depends(get_configured_auth_service),
 ):
     """
     Get the URL to redirect users to for Google OAuth login.
@@ -195,12 +180,6 @@ async def google_oauth(
     **redirect_url** should be a page in your frontend that handles the callback,
     e.g., "https://yourapp.com/auth/callback"
     """
-    if not auth_service.is_configured():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service not configured"
-        )
-
     try:
         url = auth_service.get_google_oauth_url(request.redirect_url)
         return GoogleOAuthResponse(url=url)
@@ -218,7 +197,7 @@ async def google_oauth(
 )
 async def oauth_callback(
     request: OAuthCodeExchangeRequest,
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AuthService = Depends(get_configured_auth_service),
 ):
     """
     Exchange an OAuth authorization code for session tokens.
@@ -234,12 +213,6 @@ async def oauth_callback(
     4. Backend exchanges code for tokens via Supabase
     5. Returns tokens to frontend
     """
-    if not auth_service.is_configured():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service not configured"
-        )
-
     try:
         result = await auth_service.exchange_code_for_session(request.code)
         return AuthResponse(
@@ -259,6 +232,7 @@ async def oauth_callback(
     summary="Sign out user",
 )
 async def logout(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     auth_service: AuthService = Depends(get_auth_service),
 ):
     """
@@ -275,7 +249,9 @@ async def logout(
     3. Redirect to login page
     """
     # Note: In a real implementation, you'd get the token from the request
-    # and pass it to sign_out. For now, we just return success.
+    # and pass it to sign_out. For now, we just drop it from the token cache.
+    if credentials:
+        auth_service.forget_token(credentials.credentials)
     return MessageResponse(message="Signed out successfully")
 
 
@@ -286,7 +262,7 @@ async def logout(
 )
 async def reset_password(
     request: PasswordResetRequest,
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AuthService = Depends(get_configured_auth_service),
 ):
     """
     Request a password reset email.
@@ -299,12 +275,6 @@ async def reset_password(
     **Security:** We always return success even if email doesn't exist.
     This prevents attackers from discovering which emails are registered.
     """
-    if not auth_service.is_configured():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service not configured"
-        )
-
     await auth_service.reset_password_request(
         email=request.email,
         redirect_url=request.redirect_url
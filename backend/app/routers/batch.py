@@ -0,0 +1,93 @@
+"""
+Batch API Router
+
+LEARNING NOTE:
+A dashboard screen needs several independent resources (weight history,
+meal plans, categories, ...). Fetched one after another, each costs a full
+network round trip from the phone. POST /batch takes a list of GET requests,
+runs them concurrently inside this server and returns all results at once:
+one round trip instead of N.
+
+Sub-requests are dispatched straight into the ASGI app through
+httpx.ASGITransport - no socket, no second HTTP server - so they go through
+the normal routing, validation and dependencies of each endpoint.
+
+Example:
+    POST /batch
+    {"requests": [{"path": "/weight?days=30"}, {"path": "/products/categories"}]}
+"""
+
+import asyncio
+
+import httpx
+from fastapi import APIRouter, HTTPException, Request, status
+
+from app.schemas.batch import (
+    BatchItem,
+    BatchItemResponse,
+    BatchRequest,
+    BatchResponse,
+)
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["Batch"],
+)
+
+# Headers passed on from the batch request to every sub-request
+FORWARDED_HEADERS = ("authorization", "accept-language")
+
+
+async def _dispatch(client: httpx.AsyncClient, item: BatchItem) -> BatchItemResponse:
+    """Run one sub-request against the app and capture its result."""
+    response = await client.request(item.method, item.path)
+    try:
+        body = response.json()
+    except ValueError:
+        body = response.text or None
+    return BatchItemResponse(path=item.path, status=response.status_code, body=body)
+
+
+@router.post("", response_model=BatchResponse)
+async def batch(batch_request: BatchRequest, request: Request):
+    """
+    Run up to 10 GET requests concurrently and return all their responses.
+
+    LEARNING NOTE:
+    - Each sub-request gets the caller's Authorization header, so it sees
+      the same user as a direct call would
+    - asyncio.gather(..., return_exceptions=True) lets one failing
+      sub-request report a 500 in its slot without cancelling the others
+    - A sub-request's own errors (404, 401, 422) are returned in its slot;
+      the batch itself still answers 200
+    """
+    for item in batch_request.requests:
+        if item.path.split("?", 1)[0].rstrip("/") == router.prefix:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Batch requests cannot contain /batch",
+            )
+
+    headers = {
+        name: request.headers[name]
+        for name in FORWARDED_HEADERS
+        if name in request.headers
+    }
+    transport = httpx.ASGITransport(app=request.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://batch", headers=headers
+    ) as client:
+        results = await asyncio.gather(
+            *(_dispatch(client, item) for item in batch_request.requests),
+            return_exceptions=True,
+        )
+
+    return BatchResponse(responses=[
+        result if not isinstance(result, BaseException)
+        else BatchItemResponse(
+            path=item.path,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            body={"detail": "Internal server error"},
+        )
+        for item, result in zip(batch_request.requests, results)
+    ])
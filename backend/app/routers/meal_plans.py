@@ -11,16 +11,24 @@ Key concepts:
 1. Path parameters: /meal-plans/{id} - the {id} becomes a function argument
 2. Query parameters: ?level=1&gender=male - optional filters
 3. Dependency injection: Depends(get_db) provides database session
+4. Handlers are plain `def`, not `async def`: the database Session is
+   synchronous, so FastAPI runs them in its threadpool. An `async def`
+   handler would run each blocking query on the event loop itself and make
+   every other request wait for it.
 
 TUTORIAL: https://fastapi.tiangolo.com/tutorial/path-params/
 TUTORIAL: https://fastapi.tiangolo.com/tutorial/query-params/
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload, raiseload
 from typing import Optional
+from uuid import UUID
 
 from app.database import get_db
+from app.http_cache import cached_response, make_etag
+from app.pagination import apply_cursor, set_next_cursor
 from app.models.meal_plan import MealPlan, Meal, Ingredient
 from app.models.user import Gender
 from app.schemas.meal_plan import (
@@ -38,12 +46,19 @@ router = APIRouter(
 )
 
 
+# Sort order of list_meal_plans; id makes it unique (needed for cursors)
+MEAL_PLAN_LIST_ORDER = (MealPlan.level, MealPlan.day_number, MealPlan.id)
+
+
 @router.get("", response_model=list[MealPlanListResponse])
-async def list_meal_plans(
+def list_meal_plans(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     level: Optional[int] = Query(None, ge=1, le=5, description="Filter by diet level"),
     gender: Optional[Gender] = Query(None, description="Filter by gender"),
-    skip: int = Query(0, ge=0, description="Number of records to skip (pagination)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (prefer cursor)"),
     limit: int = Query(100, ge=1, le=100, description="Max records to return"),
 ):
     """
@@ -59,6 +74,12 @@ async def list_meal_plans(
     - GET /meal-plans - All plans
     - GET /meal-plans?level=1 - Level 1 plans only
     - GET /meal-plans?gender=male&level=2 - Male, Level 2 plans
+    - GET /meal-plans?cursor=... - Next page (see app/pagination.py)
+
+    The ETag is built from the id and updated_at of every plan on the page,
+    so it changes as soon as one of them is edited (see app/http_cache.py).
+    Scripts that change a plan's meals or ingredients bump its updated_at too
+    (see scripts/link_ingredients_to_products.py).
     """
     # Start building the query
     query = db.query(MealPlan)
@@ -70,17 +91,25 @@ async def list_meal_plans(
         query = query.filter(MealPlan.gender == gender)
 
     # Order by level, then day number for logical display
-    query = query.order_by(MealPlan.level, MealPlan.day_number)
+    query = apply_cursor(query, MEAL_PLAN_LIST_ORDER, cursor)
 
     # Apply pagination
     meal_plans = query.offset(skip).limit(limit).all()
+    set_next_cursor(response, meal_plans, MEAL_PLAN_LIST_ORDER, limit)
+
+    etag = make_etag(*(f"{plan.id}@{plan.updated_at}" for plan in meal_plans))
+    not_modified = cached_response(request, response, etag)
+    if not_modified is not None:
+        return not_modified
 
     return meal_plans
 
 
 @router.get("/{meal_plan_id}", response_model=MealPlanResponse)
-async def get_meal_plan(
-    meal_plan_id: str,
+def get_meal_plan(
+    meal_plan_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
@@ -88,20 +117,47 @@ async def get_meal_plan(
 
     LEARNING NOTE:
     - {meal_plan_id} in the path becomes a function parameter
-    - joinedload() tells SQLAlchemy to fetch related data in ONE query
-      instead of making separate queries (this is called "eager loading")
+      (typed as UUID, so malformed ids get a 422 before touching the database)
+    - selectinload() tells SQLAlchemy to fetch related data up front
+      ("eager loading"): one extra query for all meals, one for all their
+      ingredients, instead of a query per meal (called "N+1 problem").
+      Unlike a joined load, the plan's columns aren't repeated on every
+      ingredient row of the result.
+    - raiseload("*") makes any OTHER relationship access raise an error
+      instead of quietly running more queries - it catches regressions
+      when someone adds a field to the response schema
+    - Ingredient.product is guarded the same way: ingredients carry their
+      own macros, so rendering a plan never needs the products table. If a
+      response ever does, add .selectinload(Ingredient.product) with a
+      load_only(...) instead - one batched query rather than one per row.
     - HTTPException with 404 is the standard way to say "not found"
-
-    Without joinedload, accessing meal_plan.meals would trigger
-    additional database queries (called "N+1 problem").
+    - A one-column query for updated_at comes first: if the client already
+      has this version (ETag, see app/http_cache.py), we answer 304 without
+      loading any meals or ingredients
     """
+    updated_at = (
+        db.query(MealPlan.updated_at)
+        .filter(MealPlan.id == str(meal_plan_id))
+        .scalar()
+    )
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Meal plan not found")
+
+    etag = make_etag(meal_plan_id, updated_at)
+    not_modified = cached_response(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
     # Eager load meals and ingredients to avoid N+1 queries
     meal_plan = (
         db.query(MealPlan)
         .options(
-            joinedload(MealPlan.meals).joinedload(Meal.ingredients)
+            selectinload(MealPlan.meals)
+            .selectinload(Meal.ingredients)
+            .raiseload(Ingredient.product),
+            raiseload("*"),
         )
-        .filter(MealPlan.id == meal_plan_id)
+        .filter(MealPlan.id == str(meal_plan_id))
         .first()
     )
 
@@ -112,7 +168,7 @@ async def get_meal_plan(
 
 
 @router.post("", response_model=MealPlanResponse, status_code=201)
-async def create_meal_plan(
+def create_meal_plan(
     meal_plan_data: MealPlanCreate,
     db: Session = Depends(get_db),
 ):
@@ -124,53 +180,79 @@ async def create_meal_plan(
     - Pydantic validates the data before this function runs
     - If validation fails, FastAPI returns a 422 error automatically
     - status_code=201 means "Created" (better than default 200 for POST)
+    - Rows are written with one INSERT per table (plan, meals, ingredients)
+      instead of one per object, then committed once
 
     This endpoint will later be restricted to admin users only.
     """
     # Create the meal plan
-    meal_plan = MealPlan(
-        level=meal_plan_data.level,
-        day_number=meal_plan_data.day_number,
-        gender=meal_plan_data.gender,
-        total_kcal=meal_plan_data.total_kcal,
-        total_protein=meal_plan_data.total_protein,
-        total_carbs=meal_plan_data.total_carbs,
-        total_fat=meal_plan_data.total_fat,
-        name=meal_plan_data.name,
-        description=meal_plan_data.description,
-    )
+    plan_row = meal_plan_data.model_dump(exclude={"meals"})
+    plan = db.execute(
+        insert(MealPlan)
+        .values(**plan_row)
+        .returning(MealPlan.id, MealPlan.created_at, MealPlan.updated_at)
+    ).one()
 
-    # Create meals and ingredients
+    # Build all meal and ingredient rows
+    meal_rows = []
+    ingredient_rows_per_meal = []
     for meal_data in meal_plan_data.meals:
-        meal = Meal(
-            meal_type=meal_data.meal_type,
-            order_index=meal_data.order_index,
-            instructions=meal_data.instructions,
-            total_kcal=sum(i.kcal for i in meal_data.ingredients),
-            total_protein=sum(i.protein for i in meal_data.ingredients),
-            total_carbs=sum(i.carbs for i in meal_data.ingredients),
-            total_fat=sum(i.fat for i in meal_data.ingredients),
-        )
-
-        # Create ingredients for this meal
+        # Meal totals, added up in one pass over the ingredients
+        kcal = protein = carbs = fat = 0
+        ingredient_rows = []
         for ing_data in meal_data.ingredients:
-            ingredient = Ingredient(
-                product_name=ing_data.product_name,
-                quantity=ing_data.quantity,
-                unit=ing_data.unit,
-                kcal=ing_data.kcal,
-                protein=ing_data.protein,
-                carbs=ing_data.carbs,
-                fat=ing_data.fat,
-                order_index=ing_data.order_index,
-            )
-            meal.ingredients.append(ingredient)
-
-        meal_plan.meals.append(meal)
-
-    # Save to database
-    db.add(meal_plan)
+            kcal += ing_data.kcal
+            protein += ing_data.protein
+            carbs += ing_data.carbs
+            fat += ing_data.fat
+            ingredient_rows.append(ing_data.model_dump())
+
+        meal_rows.append({
+            "meal_plan_id": plan.id,
+            "meal_type": meal_data.meal_type,
+            "order_index": meal_data.order_index,
+            "instructions": meal_data.instructions,
+            "total_kcal": kcal,
+            "total_protein": protein,
+            "total_carbs": carbs,
+            "total_fat": fat,
+        })
+        ingredient_rows_per_meal.append(ingredient_rows)
+
+    # One multi-row INSERT per table (see scripts/import_meal_plans.py).
+    # sort_by_parameter_order=True returns the new ids in the order of the
+    # rows we sent, so they can be matched back up.
+    meal_ids = []
+    if meal_rows:
+        meal_ids = db.scalars(
+            insert(Meal).returning(Meal.id, sort_by_parameter_order=True),
+            meal_rows,
+        ).all()
+
+    for meal_id, ingredient_rows in zip(meal_ids, ingredient_rows_per_meal):
+        for row in ingredient_rows:
+            row["meal_id"] = meal_id
+    all_ingredient_rows = [row for rows in ingredient_rows_per_meal for row in rows]
+    if all_ingredient_rows:
+        ingredient_ids = db.scalars(
+            insert(Ingredient).returning(Ingredient.id, sort_by_parameter_order=True),
+            all_ingredient_rows,
+        ).all()
+        for row, ingredient_id in zip(all_ingredient_rows, ingredient_ids):
+            row["id"] = ingredient_id
+
     db.commit()
-    db.refresh(meal_plan)
 
-    return meal_plan
+    # Everything the response needs is already here (the ids came back from
+    # RETURNING), so there's no need to load the plan back from the database
+    return MealPlanResponse(
+        **plan_row,
+        id=plan.id,
+        created_at=plan.created_at,
+        updated_at=plan.updated_at,
+        meals=[
+            {**meal_row, "id": meal_id, "ingredients": ingredient_rows}
+            for meal_row, meal_id, ingredient_rows
+            in zip(meal_rows, meal_ids, ingredient_rows_per_meal)
+        ],
+    )
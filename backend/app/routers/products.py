@@ -5,16 +5,26 @@ Endpoints for browsing the product catalog:
 - GET /products - List all products (with filters)
 - GET /products/{id} - Get a product with availability info
 - GET /products/categories - List all categories
-- GET /products/search - Full-text search with confidence ordering
+- GET /products/search - Full-text search with relevance ordering
 - GET /products/stats - Pipeline statistics
+
+Handlers are plain `def` because they use the synchronous Session (see
+app/routers/meal_plans.py).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+import re
+from threading import Lock
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session, selectinload, raiseload
 from typing import Optional
+from uuid import UUID
 
 from app.database import get_db
+from app.http_cache import cached_response, make_etag
+from app.pagination import apply_cursor, set_next_cursor
 from app.models.product import Product
 from app.schemas.product import (
     ProductListResponse,
@@ -26,59 +36,183 @@ router = APIRouter(
     tags=["Products"],
 )
 
+# LEARNING NOTE:
+# Product details are read far more often than they change (the catalog is
+# only written by the import scripts), so get_product keeps recently served
+# products in memory for a minute. The cache holds the finished response
+# model, not the ORM object: ORM objects belong to the session of the request
+# that loaded them and must not be shared between requests.
+# Each worker process has its own cache, so an edit shows up everywhere
+# within PRODUCT_CACHE_TTL seconds at most.
+PRODUCT_CACHE_TTL = 60  # seconds
+_product_cache: TTLCache = TTLCache(maxsize=512, ttl=PRODUCT_CACHE_TTL)
+_product_cache_lock = Lock()  # TTLCache isn't thread-safe
+
+# Categories and stats are whole-catalog queries that barely change, but the
+# UI asks for them on every navigation. Each cache holds a single entry; its
+# lock is held while a miss is recomputed, so concurrent requests wait for
+# that one query instead of all running it at once ("single flight").
+CATEGORIES_CACHE_TTL = 60  # seconds
+STATS_CACHE_TTL = 30  # seconds
+_categories_cache: TTLCache = TTLCache(maxsize=1, ttl=CATEGORIES_CACHE_TTL)
+_categories_cache_lock = Lock()
+_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+_stats_cache_lock = Lock()
+
+
+# LEARNING NOTE:
+# List endpoints only need the handful of columns in ProductListResponse.
+# Querying exactly those columns (instead of whole Product objects) means
+# PostgreSQL sends less data and SQLAlchemy returns light-weight rows
+# instead of building a full ORM object - with identity-map bookkeeping -
+# for each of up to 500 products. Pydantic reads rows by attribute name
+# just like ORM objects (from_attributes=True).
+PRODUCT_LIST_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.brand,
+    Product.category,
+    Product.package_size,
+    Product.unit,
+    Product.data_source,
+    Product.is_curated,
+    Product.nutriscore_grade,
+    Product.image_thumb_url.label("image_thumb_url"),
+)
+
+
+# Words of a search query: letters and digits (including umlauts), so only
+# characters that to_tsquery treats literally end up in the query string
+_SEARCH_WORD = re.compile(r"[^\W_]+")
+
+
+def _prefix_tsquery(q: str):
+    """
+    tsquery matching every word of q, the last one as a prefix; None if q has no words.
+
+    LEARNING NOTE:
+    plainto_tsquery only matches whole words, so while the user is still
+    typing ("mager qua") nothing is found. to_tsquery('mager & qua:*') asks
+    for "mager" and any word starting with "qua" - and a :* prefix is still
+    answered by the GIN index on search_vec.
+    """
+    words = _SEARCH_WORD.findall(q)
+    if not words:
+        return None
+    return func.to_tsquery("simple", " & ".join(words) + ":*")
+
+
+def _search_filter(q: str, use_fts: bool):
+    """
+    WHERE clause for a name/brand search.
+
+    LEARNING NOTE:
+    With use_fts, q is matched against Product.search_vec, which is served by
+    a GIN index: full words, plus the last one as a prefix for type-ahead
+    (see _prefix_tsquery). The ILIKE '%q%' fallback also finds substrings
+    inside words ("quark" in "Magerquark"), but the leading % means no index
+    can help, so PostgreSQL has to check every product. It is also used for
+    queries without any letters or digits, which a tsquery can't express.
+    """
+    tsquery = _prefix_tsquery(q) if use_fts else None
+    if tsquery is not None:
+        return Product.search_vec.op("@@")(tsquery)
+    pattern = f"%{q}%"
+    return Product.name.ilike(pattern) | Product.brand.ilike(pattern)
+
+
+# LEARNING NOTE:
+# SELECT DISTINCT category would read every product (or every index entry) just
+# to find a few dozen different values. PostgreSQL has no "skip scan", but a
+# recursive query can imitate one: find the smallest category, then the
+# smallest one greater than that, and so on. Each step is a single lookup in
+# ix_products_category_name_id, so the cost grows with the number of
+# categories, not the number of products.
+DISTINCT_CATEGORIES_SQL = """
+WITH RECURSIVE c(category) AS (
+    SELECT min(category) FROM products
+    UNION ALL
+    SELECT (SELECT min(category) FROM products WHERE category > c.category)
+    FROM c
+    WHERE c.category IS NOT NULL
+)
+SELECT category FROM c WHERE category IS NOT NULL
+"""
+
 
 @router.get("/categories", response_model=list[str])
-async def list_categories(db: Session = Depends(get_db)):
-    """List all product categories."""
-    rows = (
-        db.query(Product.category)
-        .distinct()
-        .order_by(Product.category)
-        .all()
-    )
-    return [r[0] for r in rows]
+def list_categories(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """
+    List all product categories.
+
+    The ETag is a hash of the list itself: it comes from the in-memory
+    cache, so fingerprinting it needs no extra query (see app/http_cache.py).
+    """
+    with _categories_cache_lock:
+        categories = _categories_cache.get("all")
+        if categories is None:
+            categories = _categories_cache["all"] = list(
+                db.scalars(text(DISTINCT_CATEGORIES_SQL))
+            )
+
+    not_modified = cached_response(request, response, make_etag(*categories))
+    if not_modified is not None:
+        return not_modified
+    return categories
 
 
 @router.get("/stats")
-async def product_stats(db: Session = Depends(get_db)):
+def product_stats(db: Session = Depends(get_db)):
     """Pipeline statistics: counts by source, nutrition coverage, etc."""
-    total = db.query(func.count(Product.id)).scalar()
-    by_source = dict(
-        db.query(Product.data_source, func.count(Product.id))
-        .group_by(Product.data_source)
-        .all()
-    )
-    curated = (
-        db.query(func.count(Product.id))
-        .filter(Product.is_curated == True)
-        .scalar()
-    )
-    with_nutrition = (
-        db.query(func.count(Product.id))
-        .filter(Product.calories_per_100g.isnot(None))
-        .scalar()
-    )
-    return {
-        "total": total,
-        "by_source": by_source,
-        "curated": curated,
-        "with_nutrition": with_nutrition,
-    }
+    with _stats_cache_lock:
+        stats = _stats_cache.get("all")
+        if stats is None:
+            stats = _stats_cache["all"] = _compute_product_stats(db)
+    return stats
+
+
+def _compute_product_stats(db: Session) -> dict:
+    """
+    Read the precomputed stats behind /products/stats.
+
+    LEARNING NOTE:
+    Counting the whole catalog on every request is wasteful when it only
+    changes when an import script runs. product_stats_mv is a "materialized
+    view": a query whose result PostgreSQL stores like a table (migration
+    c1f3a5b7d9e2). The import scripts refresh it when they finish
+    (scripts/pipeline/utils.py: refresh_product_stats), so this is a
+    one-row read.
+    """
+    row = db.execute(text(
+        "SELECT total, by_source, curated, with_nutrition FROM product_stats_mv"
+    )).mappings().first()
+    if row is None:
+        return {"total": 0, "by_source": {}, "curated": 0, "with_nutrition": 0}
+    return dict(row)
 
 
 @router.get("/search", response_model=list[ProductListResponse])
-async def search_products(
+def search_products(
     q: str = Query(..., min_length=2, description="Search query"),
     db: Session = Depends(get_db),
     limit: int = Query(20, ge=1, le=100),
+    use_fts: bool = Query(True, description="Word and prefix search (fast); false = substring search"),
 ):
-    """Full-text search across product name and brand, ordered by confidence."""
-    pattern = f"%{q}%"
+    """Full-text search across product name and brand, ordered by relevance."""
+    query = db.query(*PRODUCT_LIST_COLUMNS).filter(_search_filter(q, use_fts))
+    order = [Product.is_curated.desc()]
+    tsquery = _prefix_tsquery(q) if use_fts else None
+    if tsquery is not None:
+        # ts_rank_cd: how well (how many, how close together) the words match
+        order.append(func.ts_rank_cd(Product.search_vec, tsquery).desc())
     return (
-        db.query(Product)
-        .filter(Product.name.ilike(pattern) | Product.brand.ilike(pattern))
+        query
         .order_by(
-            Product.is_curated.desc(),
+            *order,
             Product.data_confidence.desc().nullslast(),
             Product.name,
         )
@@ -87,16 +221,23 @@ async def search_products(
     )
 
 
+# Sort order of list_products; id makes it unique (needed for cursors)
+PRODUCT_LIST_ORDER = (Product.category, Product.name, Product.id)
+
+
 @router.get("", response_model=list[ProductListResponse])
-async def list_products(
+def list_products(
+    response: Response,
     db: Session = Depends(get_db),
     category: Optional[str] = Query(None, description="Filter by category"),
     search: Optional[str] = Query(None, description="Search by name or brand"),
+    use_fts: bool = Query(True, description="Word and prefix search (fast); false = substring search"),
     data_source: Optional[str] = Query(None, description="Filter by data source"),
     curated_only: bool = Query(False, description="Only hand-picked products"),
     min_confidence: float = Query(0.0, ge=0, le=1, description="Minimum data quality"),
     has_nutrition: bool = Query(False, description="Only products with nutrition data"),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    skip: int = Query(0, ge=0, description="Rows to skip (prefer cursor)"),
     limit: int = Query(100, ge=1, le=500),
 ):
     """
@@ -108,16 +249,14 @@ async def list_products(
     - GET /products?search=quark
     - GET /products?curated_only=true
     - GET /products?data_source=off&min_confidence=0.5
+    - GET /products?cursor=... - Next page (see app/pagination.py)
     """
-    query = db.query(Product)
+    query = db.query(*PRODUCT_LIST_COLUMNS)
 
     if category:
         query = query.filter(Product.category == category)
     if search:
-        pattern = f"%{search}%"
-        query = query.filter(
-            Product.name.ilike(pattern) | Product.brand.ilike(pattern)
-        )
+        query = query.filter(_search_filter(search, use_fts))
     if data_source:
         query = query.filter(Product.data_source == data_source)
     if curated_only:
@@ -127,22 +266,36 @@ async def list_products(
     if has_nutrition:
         query = query.filter(Product.calories_per_100g.isnot(None))
 
-    query = query.order_by(Product.category, Product.name)
-    return query.offset(skip).limit(limit).all()
+    query = apply_cursor(query, PRODUCT_LIST_ORDER, cursor)
+    products = query.offset(skip).limit(limit).all()
+    set_next_cursor(response, products, PRODUCT_LIST_ORDER, limit)
+    return products
 
 
 @router.get("/{product_id}", response_model=ProductDetailResponse)
-async def get_product(
-    product_id: str,
+def get_product(
+    product_id: UUID,
     db: Session = Depends(get_db),
 ):
     """Get a product with its store availability."""
+    key = str(product_id)
+    with _product_cache_lock:
+        cached = _product_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Availability is loaded in one extra query; any other relationship
+    # (alternatives, source_links, ...) raises instead of lazy-loading.
     product = (
         db.query(Product)
-        .options(joinedload(Product.availability))
-        .filter(Product.id == product_id)
+        .options(selectinload(Product.availability), raiseload("*"))
+        .filter(Product.id == key)
         .first()
     )
     if product is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+
+    response = ProductDetailResponse.model_validate(product)
+    with _product_cache_lock:
+        _product_cache[key] = response
+    return response
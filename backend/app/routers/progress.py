@@ -14,16 +14,22 @@ The weight graph is Apple Health-inspired:
 - Dotted lines for gaps (interpolated)
 - Shows trend and stall warnings
 
+Handlers are plain `def` because they use the synchronous Session (see
+app/routers/meal_plans.py).
+
 TUTORIAL: https://fastapi.tiangolo.com/tutorial/sql-databases/
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from datetime import date, timedelta
 from typing import Optional, List
+from uuid import UUID
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.user import User
 from app.models.progress import WeightEntry
 from app.dependencies import get_current_user
@@ -42,6 +48,19 @@ router = APIRouter(
     tags=["Weight Tracking"],
 )
 
+# LEARNING NOTE:
+# The read-only history queries select just these columns. They come back as
+# light-weight Row objects (e.measured_at works just like on a WeightEntry)
+# instead of full ORM objects, which skips the identity map and change
+# tracking that are only needed for objects you are going to modify.
+WEIGHT_ENTRY_COLUMNS = (
+    WeightEntry.id,
+    WeightEntry.weight_kg,
+    WeightEntry.measured_at,
+    WeightEntry.notes,
+    WeightEntry.created_at,
+)
+
 
 # =============================================================================
 # Weight Entry CRUD
@@ -53,7 +72,7 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
     summary="Log a weight entry",
 )
-async def create_weight_entry(
+def create_weight_entry(
     entry_data: WeightEntryCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -62,47 +81,41 @@ async def create_weight_entry(
     Log a new weight measurement.
 
     LEARNING NOTE:
-    - We prevent duplicate entries for the same date
-    - This also updates the user's current_weight_kg to latest
-    - If this is first entry, also sets starting_weight_kg
+    - We prevent duplicate entries for the same date: the unique index on
+      (user_id, measured_at) makes INSERT ... ON CONFLICT DO NOTHING skip
+      the row, and RETURNING then returns nothing. No separate "does it
+      exist?" query (which two parallel requests could both pass).
+    - The user's current_weight_kg follows their latest entry automatically
+      (a database trigger on weight_entries keeps it in sync)
+    - If the user has no starting_weight_kg yet, the same trigger sets it
+    - So logging a weight is just INSERT ... RETURNING + COMMIT
     """
-    # Check if entry already exists for this date
-    existing = db.query(WeightEntry).filter(
-        WeightEntry.user_id == current_user.id,
-        WeightEntry.measured_at == entry_data.measured_at
+    # Create the entry; RETURNING WeightEntry hands back the new row as an
+    # ORM object, or nothing if this date already had an entry
+    new_entry = db.scalars(
+        insert(WeightEntry)
+        .values(
+            user_id=current_user.id,
+            weight_kg=entry_data.weight_kg,
+            measured_at=entry_data.measured_at,
+            notes=entry_data.notes,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "measured_at"])
+        .returning(WeightEntry)
     ).first()
 
-    if existing:
+    if new_entry is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Entry already exists for {entry_data.measured_at}. Use PATCH to update."
         )
 
-    # Create the entry
-    new_entry = WeightEntry(
-        user_id=current_user.id,
-        weight_kg=entry_data.weight_kg,
-        measured_at=entry_data.measured_at,
-        notes=entry_data.notes,
-    )
-    db.add(new_entry)
-
-    # Update user's current weight if this is the most recent entry
-    latest_entry = db.query(WeightEntry).filter(
-        WeightEntry.user_id == current_user.id
-    ).order_by(desc(WeightEntry.measured_at)).first()
-
-    if not latest_entry or entry_data.measured_at >= latest_entry.measured_at:
-        current_user.current_weight_kg = entry_data.weight_kg
-
-    # If user doesn't have starting weight, set it
-    if current_user.starting_weight_kg is None:
-        current_user.starting_weight_kg = entry_data.weight_kg
-
+    # Everything the response needs came back with the INSERT - no extra
+    # SELECT afterwards
+    response = WeightEntryResponse.model_validate(new_entry)
     db.commit()
-    db.refresh(new_entry)
 
-    return new_entry
+    return response
 
 
 @router.get(
@@ -110,9 +123,9 @@ async def create_weight_entry(
     response_model=WeightHistoryResponse,
     summary="Get weight history with stats",
 )
-async def get_weight_history(
+def get_weight_history(
     days: int = Query(30, ge=7, le=365, description="Number of days of history"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -126,26 +139,32 @@ async def get_weight_history(
 
     Query params:
     - days: How far back to look (default 30, max 365)
+
+    Only reads, so it uses get_read_db (a read replica, if configured).
     """
     # Calculate date range
     end_date = date.today()
     start_date = end_date - timedelta(days=days)
 
     # Get entries in range, ordered by date
-    entries = db.query(WeightEntry).filter(
-        WeightEntry.user_id == current_user.id,
-        WeightEntry.measured_at >= start_date,
-        WeightEntry.measured_at <= end_date
-    ).order_by(WeightEntry.measured_at).all()
+    entries = db.execute(
+        select(*WEIGHT_ENTRY_COLUMNS).where(
+            WeightEntry.user_id == current_user.id,
+            WeightEntry.measured_at >= start_date,
+            WeightEntry.measured_at <= end_date
+        ).order_by(WeightEntry.measured_at)
+    ).all()
 
     # Build history with interpolation for gaps
-    history = build_history_with_interpolation(entries, start_date, end_date)
+    history = build_history_with_interpolation(entries)
 
     # Compute stats
     stats = compute_weight_stats(current_user, entries)
 
-    # Detect stalls (looks at last 14 days)
-    stall_status = detect_stall(db, current_user)
+    # Detect stalls (looks at last 14 days - already loaded if days >= 14)
+    stall_status = detect_stall(
+        db, current_user, entries if days >= STALL_WINDOW_DAYS else None
+    )
 
     return WeightHistoryResponse(
         history=history,
@@ -160,14 +179,14 @@ async def get_weight_history(
     response_model=WeightEntryResponse,
     summary="Get single weight entry",
 )
-async def get_weight_entry(
-    entry_id: str,
+def get_weight_entry(
+    entry_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get a specific weight entry by ID."""
     entry = db.query(WeightEntry).filter(
-        WeightEntry.id == entry_id,
+        WeightEntry.id == str(entry_id),
         WeightEntry.user_id == current_user.id
     ).first()
 
@@ -185,8 +204,8 @@ async def get_weight_entry(
     response_model=WeightEntryResponse,
     summary="Update weight entry",
 )
-async def update_weight_entry(
-    entry_id: str,
+def update_weight_entry(
+    entry_id: UUID,
     updates: WeightEntryUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -198,7 +217,7 @@ async def update_weight_entry(
     Uses PATCH semantics - only send fields you want to change.
     """
     entry = db.query(WeightEntry).filter(
-        WeightEntry.id == entry_id,
+        WeightEntry.id == str(entry_id),
         WeightEntry.user_id == current_user.id
     ).first()
 
@@ -213,18 +232,19 @@ async def update_weight_entry(
     for field, value in update_data.items():
         setattr(entry, field, value)
 
-    # If weight changed, may need to update user's current_weight_kg
-    if 'weight_kg' in update_data:
-        latest = db.query(WeightEntry).filter(
-            WeightEntry.user_id == current_user.id
-        ).order_by(desc(WeightEntry.measured_at)).first()
-
-        if latest and latest.id == entry_id:
-            current_user.current_weight_kg = update_data['weight_kg']
-
-    db.commit()
-    db.refresh(entry)
+    # current_weight_kg is re-synced by the weight_entries trigger
+    try:
+        db.commit()
+    except IntegrityError:
+        # Moved to a date that already has an entry
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Entry already exists for {updates.measured_at}."
+        )
 
+    # No refresh needed: the session keeps the values after commit and none
+    # of the response's columns are changed by the database
     return entry
 
 
@@ -233,8 +253,8 @@ async def update_weight_entry(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete weight entry",
 )
-async def delete_weight_entry(
-    entry_id: str,
+def delete_weight_entry(
+    entry_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -245,7 +265,7 @@ async def delete_weight_entry(
     Returns 204 No Content on success (REST convention for DELETE).
     """
     entry = db.query(WeightEntry).filter(
-        WeightEntry.id == entry_id,
+        WeightEntry.id == str(entry_id),
         WeightEntry.user_id == current_user.id
     ).first()
 
@@ -255,18 +275,11 @@ async def delete_weight_entry(
             detail="Weight entry not found"
         )
 
+    # current_weight_kg falls back to the latest remaining entry via the
+    # weight_entries trigger
     db.delete(entry)
     db.commit()
 
-    # Update current_weight to latest remaining entry
-    latest = db.query(WeightEntry).filter(
-        WeightEntry.user_id == current_user.id
-    ).order_by(desc(WeightEntry.measured_at)).first()
-
-    if latest:
-        current_user.current_weight_kg = latest.weight_kg
-        db.commit()
-
 
 # =============================================================================
 # Helper Functions
@@ -274,12 +287,16 @@ async def delete_weight_entry(
 
 def build_history_with_interpolation(
     entries: List[WeightEntry],
-    start_date: date,
-    end_date: date
 ) -> List[WeightHistoryPoint]:
     """
     Build weight history with interpolated points for gaps.
 
+    entries must be sorted by measured_at, oldest first (the queries in this
+    module ORDER BY measured_at), so the first and last entry are the date
+    range and neighbouring entries bound each gap. The caller's query already
+    limits them to the requested days; days before the first or after the
+    last entry are not filled in.
+
     LEARNING NOTE:
     For gaps in data (days without entries), we create interpolated points.
     The frontend draws these as dotted lines instead of solid lines.
@@ -291,58 +308,56 @@ def build_history_with_interpolation(
     """
     if not entries:
         return []
-
+    if len(entries) == 1:
+        # Common right after the first weigh-in: nothing to interpolate
+        only = entries[0]
+        return [WeightHistoryPoint.model_construct(
+            date=only.measured_at, weight_kg=only.weight_kg, is_interpolated=False
+        )]
+
+    # entries come sorted by date (one per day), so each gap lies between
+    # two neighbouring entries: walk the pairs once and fill in the days
+    # between them, instead of searching ahead for the next entry each day
+    #
+    # The work is a handful of float operations per day (a year of history is
+    # ~365 points), far too little for NumPy to pay for its import and array
+    # conversions - building the response objects costs more than the maths.
+    #
+    # model_construct() builds each point without running Pydantic's
+    # validation: the values come straight from the database and our own
+    # arithmetic, so they already have the right types.
+    point = WeightHistoryPoint.model_construct
+    one_day = timedelta(days=1)
     history = []
-
-    # Convert entries to dict for quick lookup
-    entry_map = {e.measured_at: e.weight_kg for e in entries}
-
-    # Find actual min/max dates from entries
-    min_date = min(e.measured_at for e in entries)
-    max_date = max(e.measured_at for e in entries)
-
-    # Iterate through each day in range
-    current_date = min_date
-    prev_weight = None
-    prev_date = None
-
-    while current_date <= max_date:
-        if current_date in entry_map:
-            # Actual entry
-            weight = entry_map[current_date]
-            history.append(WeightHistoryPoint(
-                date=current_date,
-                weight_kg=weight,
-                is_interpolated=False
+    append = history.append
+    for prev, next_ in zip(entries, entries[1:]):
+        append(point(
+            date=prev.measured_at,
+            weight_kg=prev.weight_kg,
+            is_interpolated=False
+        ))
+
+        # Linear interpolation for the missing days in between
+        total_days = (next_.measured_at - prev.measured_at).days
+        if total_days < 2:
+            continue
+        start_weight = prev.weight_kg
+        weight_change = next_.weight_kg - start_weight
+        day = prev.measured_at
+        for offset in range(1, total_days):
+            day += one_day
+            append(point(
+                date=day,
+                weight_kg=round(start_weight + weight_change * offset / total_days, 1),
+                is_interpolated=True
             ))
-            prev_weight = weight
-            prev_date = current_date
-        else:
-            # Gap - need to interpolate
-            # Find next actual entry
-            next_date = current_date + timedelta(days=1)
-            next_weight = None
-
-            while next_date <= max_date:
-                if next_date in entry_map:
-                    next_weight = entry_map[next_date]
-                    break
-                next_date += timedelta(days=1)
-
-            if prev_weight is not None and next_weight is not None:
-                # Linear interpolation
-                days_since_prev = (current_date - prev_date).days
-                total_days = (next_date - prev_date).days
-                if total_days > 0:
-                    weight_change = next_weight - prev_weight
-                    interpolated_weight = prev_weight + (weight_change * days_since_prev / total_days)
-                    history.append(WeightHistoryPoint(
-                        date=current_date,
-                        weight_kg=round(interpolated_weight, 1),
-                        is_interpolated=True
-                    ))
-
-        current_date += timedelta(days=1)
+
+    last = entries[-1]
+    append(point(
+        date=last.measured_at,
+        weight_kg=last.weight_kg,
+        is_interpolated=False
+    ))
 
     return history
 
@@ -351,6 +366,9 @@ def compute_weight_stats(user: User, entries: List[WeightEntry]) -> WeightStats:
     """
     Compute weight progress statistics.
 
+    entries must be sorted by measured_at, oldest first: entries[0] is the
+    earliest and entries[-1] the current weight.
+
     LEARNING NOTE:
     These stats appear above the weight graph to show progress at a glance.
     """
@@ -370,17 +388,18 @@ def compute_weight_stats(user: User, entries: List[WeightEntry]) -> WeightStats:
     progress = None
 
     if starting and current:
-        total_lost = round(starting - current, 1)
+        lost = starting - current  # unrounded, reused for progress below
+        total_lost = round(lost, 1)
+
+        if goal:
+            total_to_lose = starting - goal
+            if total_to_lose > 0:
+                progress = round(lost / total_to_lose * 100, 1)
+                progress = max(0, min(100, progress))  # Clamp to 0-100
 
     if current and goal:
         remaining = round(current - goal, 1)
 
-    if starting and goal and current:
-        total_to_lose = starting - goal
-        if total_to_lose > 0:
-            progress = round(((starting - current) / total_to_lose) * 100, 1)
-            progress = max(0, min(100, progress))  # Clamp to 0-100
-
     return WeightStats(
         starting_weight_kg=starting,
         current_weight_kg=current,
@@ -391,10 +410,21 @@ def compute_weight_stats(user: User, entries: List[WeightEntry]) -> WeightStats:
     )
 
 
-def detect_stall(db: Session, user: User) -> StallStatus:
+STALL_WINDOW_DAYS = 14
+
+
+def detect_stall(
+    db: Session,
+    user: User,
+    entries: Optional[List[WeightEntry]] = None,
+) -> StallStatus:
     """
     Detect if user is in a weight stall.
 
+    entries: the user's entries for a window that covers the last 14 days,
+    sorted by measured_at (oldest first), if the caller already has them -
+    saves a query.
+
     LEARNING NOTE:
     Stall detection rules (from conversation):
     - Look at last 14 days
@@ -406,15 +436,34 @@ def detect_stall(db: Session, user: User) -> StallStatus:
     """
     # Look at last 14 days
     end_date = date.today()
-    start_date = end_date - timedelta(days=14)
-
-    entries = db.query(WeightEntry).filter(
-        WeightEntry.user_id == user.id,
-        WeightEntry.measured_at >= start_date,
-        WeightEntry.measured_at <= end_date
-    ).order_by(WeightEntry.measured_at).all()
+    start_date = end_date - timedelta(days=STALL_WINDOW_DAYS)
+
+    if entries is None:
+        # Only the count and the first/last weight are needed, so PostgreSQL
+        # works them out and sends back one row instead of every entry.
+        # array_agg(... ORDER BY ...)[1] is "the first value in that order".
+        entry_count, first_weight, last_weight = db.execute(
+            select(
+                func.count(),
+                func.array_agg(
+                    aggregate_order_by(WeightEntry.weight_kg, WeightEntry.measured_at)
+                )[1],
+                func.array_agg(
+                    aggregate_order_by(WeightEntry.weight_kg, WeightEntry.measured_at.desc())
+                )[1],
+            ).where(
+                WeightEntry.user_id == user.id,
+                WeightEntry.measured_at >= start_date,
+                WeightEntry.measured_at <= end_date
+            )
+        ).one()
+    else:
+        entries = [e for e in entries if start_date <= e.measured_at <= end_date]
+        entry_count = len(entries)
+        if entries:
+            first_weight = entries[0].weight_kg
+            last_weight = entries[-1].weight_kg
 
-    entry_count = len(entries)
     min_entries = 4
 
     # Not enough data to detect
@@ -429,8 +478,6 @@ def detect_stall(db: Session, user: User) -> StallStatus:
         )
 
     # Calculate weight change
-    first_weight = entries[0].weight_kg
-    last_weight = entries[-1].weight_kg
     weight_change = last_weight - first_weight  # Negative = loss
 
     # Stall threshold: ±0.5kg
@@ -9,10 +9,11 @@ Handles:
 - Promo code validation
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request, Header, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request, Header, status
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.services.stripe_service import StripeService, get_stripe_service
@@ -28,9 +29,12 @@ from app.schemas.subscription import (
     SubscriptionStatus,
 )
 
+import logging
 import stripe
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/subscriptions",
     tags=["Subscriptions"],
@@ -240,9 +244,9 @@ async def validate_promo_code(
 )
 async def stripe_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     stripe_signature: str = Header(alias="stripe-signature"),
     stripe_service: StripeService = Depends(get_stripe_service),
-    db: Session = Depends(get_db),
 ):
     """
     Handle Stripe webhook events.
@@ -254,6 +258,11 @@ async def stripe_webhook(
 
     IMPORTANT: This endpoint must be publicly accessible.
     Stripe verifies authenticity via the signature header.
+
+    LEARNING NOTE:
+    Stripe retries a webhook if we don't answer quickly. So we only check
+    the signature here and hand the database work to a background task:
+    FastAPI sends the 200 response first and runs the task right after.
     """
     # Get raw request body
     payload = await request.body()
@@ -274,34 +283,10 @@ async def stripe_webhook(
             detail="Invalid signature",
         )
 
-    # Handle different event types
-    event_type = event["type"]
-    data = event["data"]["object"]
-
-    try:
-        if event_type == "checkout.session.completed":
-            # User completed checkout
-            await handle_checkout_completed(data, db)
-
-        elif event_type == "customer.subscription.created":
-            # New subscription created
-            await handle_subscription_created(data, db)
-
-        elif event_type == "customer.subscription.updated":
-            # Subscription updated (status change, plan change, etc.)
-            await handle_subscription_updated(data, db)
-
-        elif event_type == "customer.subscription.deleted":
-            # Subscription cancelled/expired
-            await handle_subscription_deleted(data, db)
-
-        elif event_type == "invoice.payment_failed":
-            # Payment failed
-            await handle_payment_failed(data, db)
-
-    except Exception as e:
-        # Log error but return 200 to acknowledge receipt
-        print(f"Webhook handler error: {e}")
+    # Handle the event after the response has been sent
+    background_tasks.add_task(
+        dispatch_webhook_event, event["type"], event["data"]["object"]
+    )
 
     return WebhookResponse(received=True)
 
@@ -310,7 +295,13 @@ async def stripe_webhook(
 # Webhook Event Handlers
 # =============================================================================
 
-async def handle_checkout_completed(data: dict, db: Session):
+# LEARNING NOTE:
+# Each handler is a single UPDATE ... WHERE statement instead of loading the
+# user (SELECT) and then saving the changes (UPDATE): one round trip to the
+# database per event. If no user matches, the UPDATE simply changes 0 rows.
+# Stripe retries webhooks that answer slowly, so keeping these fast matters.
+
+def handle_checkout_completed(data: dict, db: Session):
     """Handle successful checkout completion"""
     user_id = data.get("client_reference_id")
     customer_id = data.get("customer")
@@ -318,57 +309,94 @@ async def handle_checkout_completed(data: dict, db: Session):
     if not user_id:
         return
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user:
-        user.stripe_customer_id = customer_id
-        user.subscription_status = "active"
-        db.commit()
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(stripe_customer_id=customer_id, subscription_status="active")
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
 
 
-async def handle_subscription_created(data: dict, db: Session):
-    """Handle new subscription creation"""
-    customer_id = data.get("customer")
+def _subscription_values(data: dict, default_status: str = None) -> dict:
+    """Columns to set from a Stripe subscription object."""
+    values = {}
+    status_value = data.get("status", default_status)
+    if status_value:
+        values["subscription_status"] = status_value
+    if data.get("current_period_end"):
+        values["subscription_ends_at"] = datetime.fromtimestamp(
+            data["current_period_end"]
+        )
+    return values
 
-    user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
-    if user:
-        user.subscription_status = data.get("status", "active")
-        if data.get("current_period_end"):
-            user.subscription_ends_at = datetime.fromtimestamp(
-                data["current_period_end"]
-            )
-        db.commit()
 
+def _update_by_customer(db: Session, customer_id: str, values: dict):
+    """Apply `values` to the user with this Stripe customer id."""
+    if not customer_id or not values:
+        return
+    # synchronize_session=False: no User objects are loaded in this session,
+    # so SQLAlchemy needn't look for any to update in memory
+    db.execute(
+        update(User)
+        .where(User.stripe_customer_id == customer_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
 
-async def handle_subscription_updated(data: dict, db: Session):
-    """Handle subscription updates"""
-    customer_id = data.get("customer")
 
-    user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
-    if user:
-        user.subscription_status = data.get("status", user.subscription_status)
-        if data.get("current_period_end"):
-            user.subscription_ends_at = datetime.fromtimestamp(
-                data["current_period_end"]
-            )
-        db.commit()
+def handle_subscription_created(data: dict, db: Session):
+    """Handle new subscription creation"""
+    _update_by_customer(db, data.get("customer"), _subscription_values(data, "active"))
 
 
-async def handle_subscription_deleted(data: dict, db: Session):
-    """Handle subscription cancellation/deletion"""
-    customer_id = data.get("customer")
+def handle_subscription_updated(data: dict, db: Session):
+    """Handle subscription updates"""
+    # Without a status in the event, the stored status is kept
+    _update_by_customer(db, data.get("customer"), _subscription_values(data))
+
 
-    user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
-    if user:
-        user.subscription_status = "cancelled"
-        user.subscription_ends_at = None
-        db.commit()
+def handle_subscription_deleted(data: dict, db: Session):
+    """Handle subscription cancellation/deletion"""
+    _update_by_customer(
+        db,
+        data.get("customer"),
+        {"subscription_status": "cancelled", "subscription_ends_at": None},
+    )
 
 
-async def handle_payment_failed(data: dict, db: Session):
+def handle_payment_failed(data: dict, db: Session):
     """Handle failed payment"""
-    customer_id = data.get("customer")
+    _update_by_customer(db, data.get("customer"), {"subscription_status": "past_due"})
+
+
+# Stripe event type -> handler
+WEBHOOK_HANDLERS = {
+    "checkout.session.completed": handle_checkout_completed,  # User completed checkout
+    "customer.subscription.created": handle_subscription_created,  # New subscription
+    "customer.subscription.updated": handle_subscription_updated,  # Status/plan change
+    "customer.subscription.deleted": handle_subscription_deleted,  # Cancelled/expired
+    "invoice.payment_failed": handle_payment_failed,
+}
+
+
+def dispatch_webhook_event(event_type: str, data: dict):
+    """
+    Run the handler for a verified webhook event (as a background task).
+
+    LEARNING NOTE:
+    Background tasks run after the request is finished, when the request's
+    own database session (Depends(get_db)) is already closed, so this opens
+    its own. Being a plain `def`, it runs in the threadpool.
+    """
+    handler = WEBHOOK_HANDLERS.get(event_type)
+    if handler is None:
+        return
 
-    user = db.query(User).filter(User.stripe_customer_id == customer_id).first()
-    if user:
-        user.subscription_status = "past_due"
-        db.commit()
+    with SessionLocal() as db:
+        try:
+            handler(data, db)
+        except Exception:
+            # Stripe already got its 200 - log (with traceback) and move on
+            logger.exception("Stripe webhook handler failed for %s", event_type)
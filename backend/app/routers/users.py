@@ -5,15 +5,22 @@ LEARNING NOTE:
 This router handles:
 - GET /users/me - Get current user's profile
 - POST /users/me/intake - Complete intake form (new users)
+- POST /users/me/intake/screen1..3 - Same, one screen at a time (older clients)
 - PATCH /users/me - Update profile (existing users)
 
 All endpoints require authentication.
 The "me" pattern is common - it means "the currently logged-in user".
+Handlers are plain `def` because they use the synchronous Session (see
+app/routers/meal_plans.py).
 
 TUTORIAL: https://fastapi.tiangolo.com/tutorial/security/
 """
 
+from bisect import bisect_right
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -34,12 +41,49 @@ router = APIRouter(
 )
 
 
+# Columns PATCH /users/me may change: the fields of ProfileUpdate that are
+# real users columns. Worked out once at import; anything else in a request
+# (id, email, subscription fields, ...) can never be written by accident.
+PROFILE_UPDATE_FIELDS = frozenset(ProfileUpdate.model_fields) & frozenset(
+    User.__table__.columns.keys()
+)
+
+
+def _update_user(
+    db: Session, user: User, values: dict, *conditions
+) -> Optional[UserProfileResponse]:
+    """
+    Save `values` on the user and commit; returns the updated profile.
+
+    conditions: extra WHERE clauses; if the row no longer matches them,
+    nothing is written and None is returned.
+
+    LEARNING NOTE:
+    Setting attributes and then calling db.refresh() costs two round trips:
+    the UPDATE, then a SELECT to read the row back (updated_at is set by
+    PostgreSQL, so SQLAlchemy can't know it). UPDATE ... RETURNING does both
+    in one statement, and SQLAlchemy copies the returned values onto `user`.
+    """
+    if values:
+        user = db.scalars(
+            update(User)
+            .where(User.id == user.id, *conditions)
+            .values(**values)
+            .returning(User)
+        ).one_or_none()
+        if user is None:
+            return None
+    response = UserProfileResponse.from_user(user)
+    db.commit()
+    return response
+
+
 @router.get(
     "/me",
     response_model=UserProfileResponse,
     summary="Get current user profile",
 )
-async def get_my_profile(
+def get_my_profile(
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -61,7 +105,7 @@ async def get_my_profile(
         400: {"description": "Intake already completed"},
     }
 )
-async def complete_intake(
+def complete_intake(
     intake_data: IntakeComplete,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -73,42 +117,53 @@ async def complete_intake(
     This is called once when a user first signs up.
     After this, intake_completed=True and they see the main app.
 
+    The intake page keeps the answers of all three screens in the browser
+    and sends them here together: one request and one UPDATE, instead of a
+    request and a commit per screen.
+
     The starting_weight_kg is set here and never changes -
     it's used to show total progress over time.
     """
-    # Check if intake already completed
+    already_completed = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Intake form already completed. Use PATCH /users/me to update profile."
+    )
+
+    # Check if intake already completed (as far as this request knows)
     if current_user.intake_completed:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Intake form already completed. Use PATCH /users/me to update profile."
-        )
+        raise already_completed
 
     # Update user with intake data
-    current_user.gender = intake_data.gender
-    current_user.height_cm = intake_data.height_cm
-    current_user.age = intake_data.age
-    current_user.current_weight_kg = intake_data.current_weight_kg
-    current_user.starting_weight_kg = intake_data.current_weight_kg  # Capture starting weight
+    values = {
+        "gender": intake_data.gender,
+        "height_cm": intake_data.height_cm,
+        "age": intake_data.age,
+        "current_weight_kg": intake_data.current_weight_kg,
+        "starting_weight_kg": intake_data.current_weight_kg,  # Capture starting weight
+        # Calculate starting level based on calorie awareness
+        "current_level": calculate_starting_level(
+            gender=intake_data.gender,
+            current_weight_kg=intake_data.current_weight_kg,
+            calorie_awareness=intake_data.calorie_awareness,
+            known_calorie_intake=intake_data.known_calorie_intake,
+        ),
+        # Mark intake as complete
+        "intake_completed": True,
+    }
 
-    # Convert list to comma-separated string for storage
+    # Stored as a text[] array, so the list goes in as-is
     if intake_data.dietary_restrictions:
-        current_user.dietary_restrictions = ','.join(intake_data.dietary_restrictions)
-
-    # Calculate starting level based on calorie awareness
-    current_user.current_level = calculate_starting_level(
-        gender=intake_data.gender,
-        current_weight_kg=intake_data.current_weight_kg,
-        calorie_awareness=intake_data.calorie_awareness,
-        known_calorie_intake=intake_data.known_calorie_intake,
-    )
-
-    # Mark intake as complete
-    current_user.intake_completed = True
-
-    db.commit()
-    db.refresh(current_user)
+        values["dietary_restrictions"] = intake_data.dietary_restrictions
 
-    return UserProfileResponse.from_user(current_user)
+    # LEARNING NOTE:
+    # The check above uses the user loaded at the start of the request. A
+    # double-submitted form can pass it twice, so the UPDATE repeats it in
+    # its WHERE clause: only one of them can flip intake_completed, the other
+    # matches no row and gets the 400 - no extra query, no race.
+    profile = _update_user(db, current_user, values, User.intake_completed == False)
+    if profile is None:
+        raise already_completed
+    return profile
 
 
 @router.post(
@@ -116,7 +171,7 @@ async def complete_intake(
     response_model=dict,
     summary="Save intake screen 1 (partial)",
 )
-async def save_intake_screen1(
+def save_intake_screen1(
     screen_data: IntakeScreen1,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -128,6 +183,9 @@ async def save_intake_screen1(
     This allows saving progress between screens.
     User can close app and resume later.
     intake_completed stays False until all screens done.
+
+    The app itself now submits the whole intake via POST /users/me/intake;
+    the per-screen endpoints are kept for clients that still use them.
     """
     current_user.gender = screen_data.gender
     current_user.height_cm = screen_data.height_cm
@@ -143,7 +201,7 @@ async def save_intake_screen1(
     response_model=dict,
     summary="Save intake screen 2 (partial)",
 )
-async def save_intake_screen2(
+def save_intake_screen2(
     screen_data: IntakeScreen2,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -162,7 +220,7 @@ async def save_intake_screen2(
     response_model=UserProfileResponse,
     summary="Save intake screen 3 and complete intake",
 )
-async def save_intake_screen3(
+def save_intake_screen3(
     screen_data: IntakeScreen3,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -183,23 +241,21 @@ async def save_intake_screen3(
             detail="Please complete screens 1 and 2 first"
         )
 
-    if screen_data.dietary_restrictions:
-        current_user.dietary_restrictions = ','.join(screen_data.dietary_restrictions)
-
-    # Calculate starting level based on calorie awareness
-    current_user.current_level = calculate_starting_level(
-        gender=current_user.gender,
-        current_weight_kg=current_user.current_weight_kg,
-        calorie_awareness=screen_data.calorie_awareness,
-        known_calorie_intake=screen_data.known_calorie_intake,
-    )
-
-    current_user.intake_completed = True
+    values = {
+        # Calculate starting level based on calorie awareness
+        "current_level": calculate_starting_level(
+            gender=current_user.gender,
+            current_weight_kg=current_user.current_weight_kg,
+            calorie_awareness=screen_data.calorie_awareness,
+            known_calorie_intake=screen_data.known_calorie_intake,
+        ),
+        "intake_completed": True,
+    }
 
-    db.commit()
-    db.refresh(current_user)
+    if screen_data.dietary_restrictions:
+        values["dietary_restrictions"] = screen_data.dietary_restrictions
 
-    return UserProfileResponse.from_user(current_user)
+    return _update_user(db, current_user, values)
 
 
 @router.patch(
@@ -207,7 +263,7 @@ async def save_intake_screen3(
     response_model=UserProfileResponse,
     summary="Update profile",
 )
-async def update_profile(
+def update_profile(
     updates: ProfileUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -221,22 +277,35 @@ async def update_profile(
 
     Example: To just update weight, send: {"current_weight_kg": 82.5}
     """
-    # Get the fields that were actually provided (not None)
-    update_data = updates.model_dump(exclude_unset=True)
+    # model_fields_set: the names of the fields the request actually sent.
+    # Reading just those attributes skips building a dict of every field
+    # (model_dump) only to throw most of it away.
+    values = {
+        field: getattr(updates, field)
+        for field in updates.model_fields_set & PROFILE_UPDATE_FIELDS
+    }
 
-    # Handle dietary_restrictions specially (list to string)
-    if 'dietary_restrictions' in update_data and update_data['dietary_restrictions'] is not None:
-        update_data['dietary_restrictions'] = ','.join(update_data['dietary_restrictions'])
+    # Save the provided fields in one UPDATE ... RETURNING
+    return _update_user(db, current_user, values)
 
-    # Update each provided field
-    for field, value in update_data.items():
-        if hasattr(current_user, field):
-            setattr(current_user, field, value)
 
-    db.commit()
-    db.refresh(current_user)
+# Daily calories per diet level (level 1 → 5), see calculate_starting_level.
+# Module constants, so they're built once instead of on every call.
+MALE_CALORIE_LEVELS = ((1, 2700), (2, 2400), (3, 2100), (4, 1800), (5, 1500))
+FEMALE_CALORIE_LEVELS = ((1, 2400), (2, 2100), (3, 1800), (4, 1500), (5, 1200))
 
-    return UserProfileResponse.from_user(current_user)
+
+def _ascending_kcal(calorie_levels: tuple) -> tuple[tuple, tuple]:
+    """(kcal sorted ascending, level for each of those kcal), for bisect."""
+    by_kcal = sorted(calorie_levels, key=lambda level_kcal: level_kcal[1])
+    return (
+        tuple(kcal for _, kcal in by_kcal),
+        tuple(level for level, _ in by_kcal),
+    )
+
+
+_MALE_KCAL_ASC = _ascending_kcal(MALE_CALORIE_LEVELS)
+_FEMALE_KCAL_ASC = _ascending_kcal(FEMALE_CALORIE_LEVELS)
 
 
 def calculate_starting_level(
@@ -268,9 +337,9 @@ def calculate_starting_level(
     """
     # Define calorie levels by gender
     if gender == "female":
-        calorie_levels = {1: 2400, 2: 2100, 3: 1800, 4: 1500, 5: 1200}
+        calorie_levels, kcal_asc = FEMALE_CALORIE_LEVELS, _FEMALE_KCAL_ASC
     else:
-        calorie_levels = {1: 2700, 2: 2400, 3: 2100, 4: 1800, 5: 1500}
+        calorie_levels, kcal_asc = MALE_CALORIE_LEVELS, _MALE_KCAL_ASC
 
     if calorie_awareness == "unknown" or known_calorie_intake is None:
         # Estimate: body weight × 30
@@ -282,32 +351,30 @@ def calculate_starting_level(
     # For gaining/unknown: pick the level at or just below the target
     # For maintaining: pick one step below (create deficit)
     # For losing: pick the level closest to what they're already eating
-    def find_level_at_or_below(target: float) -> int:
-        """Find the highest level (lowest number) whose calories are <= target."""
-        for level in sorted(calorie_levels.keys()):
-            if calorie_levels[level] <= target:
-                return level
-        # If target is below all levels, return level 5 (lowest calories)
-        return 5
-
-    def find_closest_level(target: float) -> int:
-        """Find the level whose calories are closest to target."""
-        closest_level = 1
-        closest_diff = abs(calorie_levels[1] - target)
-        for level, kcal in calorie_levels.items():
-            diff = abs(kcal - target)
-            if diff < closest_diff:
-                closest_diff = diff
-                closest_level = level
-        return closest_level
-
     if calorie_awareness == "losing":
         # Already in deficit — match their current intake
-        return find_closest_level(target_calories)
+        return _find_closest_level(calorie_levels, target_calories)
     elif calorie_awareness == "maintaining":
         # At maintenance — go one step below
-        level = find_level_at_or_below(target_calories)
+        level = _find_level_at_or_below(kcal_asc, target_calories)
         return min(level + 1, 5)  # One step more aggressive, cap at 5
     else:
         # gaining or unknown — pick the level at or just below
-        return find_level_at_or_below(target_calories)
+        return _find_level_at_or_below(kcal_asc, target_calories)
+
+
+def _find_level_at_or_below(kcal_asc: tuple[tuple, tuple], target: float) -> int:
+    """Find the highest level (lowest number) whose calories are <= target."""
+    kcal, levels = kcal_asc
+    # bisect_right: how many levels have kcal <= target (binary search)
+    index = bisect_right(kcal, target)
+    if index == 0:
+        # If target is below all levels, return level 5 (lowest calories)
+        return 5
+    return levels[index - 1]
+
+
+def _find_closest_level(calorie_levels: tuple, target: float) -> int:
+    """Find the level whose calories are closest to target (lowest level on ties)."""
+    level, _ = min(calorie_levels, key=lambda level_kcal: abs(level_kcal[1] - target))
+    return level
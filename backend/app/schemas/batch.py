@@ -0,0 +1,44 @@
+"""
+Batch Schemas
+
+Pydantic models for POST /batch (several GET requests in one round trip).
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Literal
+
+# Upper bound on sub-requests per batch
+MAX_BATCH_SIZE = 10
+
+
+# =============================================================================
+# Request Schemas
+# =============================================================================
+
+class BatchItem(BaseModel):
+    """One sub-request, e.g. {"path": "/products/categories"}"""
+    # Only reads can be batched: sub-requests run concurrently, so there
+    # would be no defined order between writes
+    method: Literal["GET"] = "GET"
+    path: str = Field(..., pattern=r"^/", description="Path incl. query string")
+
+
+class BatchRequest(BaseModel):
+    """Request body for POST /batch"""
+    requests: list[BatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+# =============================================================================
+# Response Schemas
+# =============================================================================
+
+class BatchItemResponse(BaseModel):
+    """Result of one sub-request, in the same position as its request"""
+    path: str
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Response for POST /batch"""
+    responses: list[BatchItemResponse]
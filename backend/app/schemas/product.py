@@ -34,8 +34,7 @@ class ProductResponse(BaseModel):
     last_synced_at: Optional[datetime] = None
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ProductListResponse(BaseModel):
@@ -51,8 +50,7 @@ class ProductListResponse(BaseModel):
     nutriscore_grade: Optional[str] = None
     image_thumb_url: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ProductAvailabilityResponse(BaseModel):
@@ -62,13 +60,10 @@ class ProductAvailabilityResponse(BaseModel):
     is_available: bool
     last_verified: Optional[date] = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ProductDetailResponse(ProductResponse):
     """Full product detail including availability."""
     availability: list[ProductAvailabilityResponse] = []
-
-    class Config:
-        from_attributes = True
+    # model_config (from_attributes) is inherited from ProductResponse
@@ -192,13 +192,10 @@ class UserProfileResponse(BaseModel):
 
         LEARNING NOTE:
         We need this custom method to:
-        1. Convert dietary_restrictions string to list
+        1. Turn an empty dietary_restrictions array into None
         2. Include computed properties (bmi, etc.)
         """
-        # Convert comma-separated string to list
-        restrictions = None
-        if user.dietary_restrictions:
-            restrictions = [r.strip() for r in user.dietary_restrictions.split(',') if r.strip()]
+        restrictions = list(user.dietary_restrictions) if user.dietary_restrictions else None
 
         return cls(
             id=user.id,
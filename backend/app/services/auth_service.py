@@ -18,13 +18,32 @@ TUTORIAL: https://supabase.com/docs/guides/auth
 """
 
 from supabase import create_client, Client, ClientOptions
+from cachetools import TTLCache
 from functools import lru_cache
 from typing import Optional
 from jose import jwt, JWTError
+from starlette.concurrency import run_in_threadpool
+import hashlib
+import threading
+import time
 import httpx
 
 from app.config import get_settings
 
+# Decoded access tokens are remembered for a short while so repeat requests
+# with the same token skip the JWT decode (see AuthService.verify_token)
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+
+# Supabase's public signing keys (JWKS) change rarely; refetch them daily,
+# or a minute after a failed fetch
+JWKS_CACHE_TTL_SECONDS = 24 * 60 * 60
+JWKS_RETRY_SECONDS = 60
+
+# Signature algorithms we accept: HS256 is the legacy shared JWT secret,
+# ES256/RS256 the asymmetric keys published in the JWKS. Never "none".
+ALLOWED_JWT_ALGORITHMS = ("HS256", "ES256", "RS256")
+
 
 class AuthService:
     """
@@ -33,6 +52,15 @@ class AuthService:
     LEARNING NOTE:
     This class wraps the Supabase client and provides
     methods tailored to our app's needs.
+
+    There is one AuthService per process (see get_auth_service), so its
+    Supabase client and HTTP connections are created once and reused by
+    every request instead of paying a new TLS handshake each time.
+
+    The Supabase client is synchronous: each call blocks until Supabase
+    answers. The async methods therefore hand those calls to a worker
+    thread (run_in_threadpool) so the event loop keeps serving other
+    requests while one waits on Supabase.
     """
 
     def __init__(self):
@@ -56,10 +84,32 @@ class AuthService:
         else:
             self.client = None
 
+        # token digest -> decoded claims, shared by all requests in this process
+        self._token_cache: TTLCache = TTLCache(
+            maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL_SECONDS
+        )
+        self._token_cache_lock = threading.Lock()
+
+        # Long-lived HTTP client (keep-alive) for our own calls to Supabase
+        self._http = httpx.Client(timeout=5.0)
+
+        # Public keys for verifying token signatures (see _get_jwks)
+        self._jwks: Optional[dict] = None
+        self._jwks_expires_at = 0.0  # time.monotonic() deadline
+        self._jwks_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections (called on app shutdown)."""
+        self._http.close()
+
     def is_configured(self) -> bool:
         """Check if Supabase credentials are configured"""
         return self.client is not None
 
+    def can_verify_hs256(self) -> bool:
+        """Check if tokens signed with the legacy shared secret can be verified"""
+        return bool(self.supabase_jwt_secret)
+
     async def sign_up_with_email(self, email: str, password: str) -> dict:
         """
         Register a new user with email and password.
@@ -77,7 +127,7 @@ class AuthService:
             raise ValueError("Supabase not configured. Add credentials to .env")
 
         try:
-            response = self.client.auth.sign_up({
+            response = await run_in_threadpool(self.client.auth.sign_up, {
                 "email": email,
                 "password": password,
             })
@@ -119,7 +169,7 @@ class AuthService:
             raise ValueError("Supabase not configured. Add credentials to .env")
 
         try:
-            response = self.client.auth.sign_in_with_password({
+            response = await run_in_threadpool(self.client.auth.sign_in_with_password, {
                 "email": email,
                 "password": password,
             })
@@ -187,7 +237,7 @@ class AuthService:
             raise ValueError("Supabase not configured. Add credentials to .env")
 
         try:
-            response = self.client.auth.refresh_session(refresh_token)
+            response = await run_in_threadpool(self.client.auth.refresh_session, refresh_token)
 
             if response.session:
                 return {
@@ -201,6 +251,11 @@ class AuthService:
         except Exception as e:
             raise ValueError(f"Session refresh failed: {str(e)}")
 
+    @staticmethod
+    def _token_cache_key(token: str) -> bytes:
+        """Fixed-size digest of a token, so the cache doesn't hold raw JWTs."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
     def verify_token(self, token: str) -> Optional[dict]:
         """
         Verify a JWT access token and extract the user info.
@@ -214,31 +269,91 @@ class AuthService:
         We verify the signature using Supabase's JWT secret.
         This proves the token was issued by Supabase and hasn't been tampered with.
 
+        The same token arrives with every request the frontend makes, so the
+        decoded result is kept in a small TTL cache. Expiry is still checked
+        on every call, so a cached token never outlives its exp claim.
+
         TUTORIAL: https://jwt.io/introduction
         """
+        key = self._token_cache_key(token)
+        with self._token_cache_lock:
+            token_data = self._token_cache.get(key)
+
+        if token_data is None:
+            token_data = self._decode_token(token)
+            if token_data is None:
+                return None
+            with self._token_cache_lock:
+                self._token_cache[key] = token_data
+
+        exp = token_data["exp"]
+        if exp and time.time() > exp:
+            return None
+
+        return token_data
+
+    def forget_token(self, token: str) -> None:
+        """Drop a token from the verification cache (e.g. on logout)."""
+        with self._token_cache_lock:
+            self._token_cache.pop(self._token_cache_key(token), None)
+
+    def _get_jwks(self) -> Optional[dict]:
+        """
+        Supabase's JSON Web Key Set (public keys), cached in memory.
+
+        LEARNING NOTE:
+        Supabase signs access tokens with a private key and publishes the
+        matching public keys at /auth/v1/.well-known/jwks.json. With those
+        keys we can check a token's signature locally - no call to Supabase
+        per request. The lock makes this "single flight": when the cache
+        expires, one thread refetches while the others wait for its result
+        instead of all hitting Supabase at once.
+        """
+        with self._jwks_lock:
+            if time.monotonic() >= self._jwks_expires_at:
+                try:
+                    response = self._http.get(
+                        f"{self.supabase_url}/auth/v1/.well-known/jwks.json"
+                    )
+                    response.raise_for_status()
+                    self._jwks = response.json()
+                    self._jwks_expires_at = time.monotonic() + JWKS_CACHE_TTL_SECONDS
+                except (httpx.HTTPError, ValueError):
+                    # Keep using the previous keys (if any), retry soon
+                    self._jwks_expires_at = time.monotonic() + JWKS_RETRY_SECONDS
+            return self._jwks
+
+    def _decode_token(self, token: str) -> Optional[dict]:
+        """Decode and verify a JWT access token into our token_data dict (no caching)."""
         try:
-            # Decode and verify the token
-            # Note: Supabase uses ES256 (ECDSA) which requires a public key, not the JWT secret
-            # For MVP, we decode without signature verification since Supabase handles auth
-            # In production, you'd fetch the public key from Supabase's JWKS endpoint
+            # The header says how the token was signed. Tokens signed with the
+            # legacy shared secret (HS256) are checked against
+            # SUPABASE_JWT_SECRET, asymmetric ones (ES256/RS256) against the
+            # JWKS public keys.
+            algorithm = jwt.get_unverified_header(token).get("alg")
+            if algorithm not in ALLOWED_JWT_ALGORITHMS:
+                return None
+            if algorithm == "HS256":
+                key = self.supabase_jwt_secret
+            else:
+                key = self._get_jwks()
+            if not key:
+                # No secret / JWKS to check against (missing
+                # SUPABASE_JWT_SECRET is reported at startup, see app/main.py)
+                return None
+
             payload = jwt.decode(
                 token,
-                key="",  # Empty key since we're not verifying signature
-                options={"verify_signature": False},
+                key=key,
+                algorithms=[algorithm],
                 audience="authenticated",
             )
 
-            # Check if token is expired
-            import time
-            exp = payload.get("exp")
-            if exp and time.time() > exp:
-                return None
-
             return {
                 "user_id": payload.get("sub"),
                 "email": payload.get("email"),
                 "role": payload.get("role"),
-                "exp": exp,
+                "exp": payload.get("exp"),
             }
 
         except JWTError as e:
@@ -258,7 +373,7 @@ class AuthService:
             raise ValueError("Supabase not configured")
 
         try:
-            self.client.auth.sign_out()
+            await run_in_threadpool(self.client.auth.sign_out)
             return True
         except Exception:
             return False
@@ -275,9 +390,10 @@ class AuthService:
             raise ValueError("Supabase not configured")
 
         try:
-            self.client.auth.reset_password_email(
+            await run_in_threadpool(
+                self.client.auth.reset_password_email,
                 email,
-                options={"redirect_to": redirect_url}
+                options={"redirect_to": redirect_url},
             )
             return True
         except Exception:
@@ -296,7 +412,9 @@ class AuthService:
             raise ValueError("Supabase not configured. Add credentials to .env")
 
         try:
-            response = self.client.auth.exchange_code_for_session({"auth_code": code})
+            response = await run_in_threadpool(
+                self.client.auth.exchange_code_for_session, {"auth_code": code}
+            )
 
             if response.user and response.session:
                 return {
@@ -22,6 +22,8 @@ from app.schemas.subscription import (
     SubscriptionResponse,
 )
 
+STRIPE_TIMEOUT = 10.0  # seconds per Stripe API request
+
 
 class StripeService:
     """Service for Stripe payment operations"""
@@ -39,6 +41,19 @@ class StripeService:
         if self.secret_key:
             stripe.api_key = self.secret_key
 
+        # LEARNING NOTE:
+        # All Stripe calls below use the SDK's *_async variants, so waiting
+        # for Stripe never blocks the event loop. They share one httpx
+        # client (a connection pool): after the first call the TLS connection
+        # to api.stripe.com stays open and is reused, instead of paying a new
+        # handshake on each request.
+        self.http_client = stripe.HTTPXClient(timeout=STRIPE_TIMEOUT)
+        stripe.default_http_client = self.http_client
+
+    async def close(self) -> None:
+        """Close pooled Stripe connections (called on app shutdown)."""
+        await self.http_client.close_async()
+
     def is_configured(self) -> bool:
         """Check if Stripe is properly configured"""
         return bool(self.secret_key and self.price_monthly)
@@ -95,7 +110,7 @@ class StripeService:
         if promo_code:
             try:
                 # Look up the promotion code
-                promo_codes = stripe.PromotionCode.list(code=promo_code, active=True)
+                promo_codes = await stripe.PromotionCode.list_async(code=promo_code, active=True)
                 if promo_codes.data:
                     session_params["discounts"] = [
                         {"promotion_code": promo_codes.data[0].id}
@@ -106,7 +121,7 @@ class StripeService:
                 pass  # Ignore invalid promo codes, let user enter at checkout
 
         # Create checkout session
-        session = stripe.checkout.Session.create(**session_params)
+        session = await stripe.checkout.Session.create_async(**session_params)
 
         return {
             "checkout_url": session.url,
@@ -124,7 +139,7 @@ class StripeService:
             return stripe_customer_id
 
         # Create new customer
-        customer = stripe.Customer.create(
+        customer = await stripe.Customer.create_async(
             email=email,
             metadata={"user_id": user_id},
         )
@@ -140,7 +155,7 @@ class StripeService:
 
         try:
             # Get active subscriptions for customer
-            subscriptions = stripe.Subscription.list(
+            subscriptions = await stripe.Subscription.list_async(
                 customer=stripe_customer_id,
                 status="all",
                 limit=1,
@@ -196,7 +211,7 @@ class StripeService:
     ) -> bool:
         """Cancel a customer's subscription"""
         try:
-            subscriptions = stripe.Subscription.list(
+            subscriptions = await stripe.Subscription.list_async(
                 customer=stripe_customer_id,
                 status="active",
                 limit=1,
@@ -209,13 +224,13 @@ class StripeService:
 
             if cancel_at_period_end:
                 # Cancel at end of billing period
-                stripe.Subscription.modify(
+                await stripe.Subscription.modify_async(
                     sub.id,
                     cancel_at_period_end=True,
                 )
             else:
                 # Cancel immediately
-                stripe.Subscription.delete(sub.id)
+                await stripe.Subscription.cancel_async(sub.id)
 
             return True
 
@@ -229,7 +244,7 @@ class StripeService:
     ) -> bool:
         """Reactivate a cancelled subscription (before period ends)"""
         try:
-            subscriptions = stripe.Subscription.list(
+            subscriptions = await stripe.Subscription.list_async(
                 customer=stripe_customer_id,
                 limit=1,
             )
@@ -240,7 +255,7 @@ class StripeService:
             sub = subscriptions.data[0]
 
             if sub.cancel_at_period_end:
-                stripe.Subscription.modify(
+                await stripe.Subscription.modify_async(
                     sub.id,
                     cancel_at_period_end=False,
                 )
@@ -259,7 +274,7 @@ class StripeService:
         if not stripe_customer_id:
             raise ValueError("No Stripe customer ID provided")
 
-        session = stripe.billing_portal.Session.create(
+        session = await stripe.billing_portal.Session.create_async(
             customer=stripe_customer_id,
             return_url=f"{self.frontend_url}/profile",
         )
@@ -269,7 +284,7 @@ class StripeService:
     async def validate_promo_code(self, code: str) -> dict:
         """Validate a promotion code and return discount info"""
         try:
-            promo_codes = stripe.PromotionCode.list(code=code, active=True, limit=1)
+            promo_codes = await stripe.PromotionCode.list_async(code=code, active=True, limit=1)
 
             if not promo_codes.data:
                 return {
@@ -20,6 +20,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import SessionLocal
 from app.models.product import Product
+from scripts.pipeline.utils import refresh_product_stats
 
 USER_AGENT = "SlothDietApp/1.0 (sloth-diet-app@example.com)"
 SEARCH_URL = "https://world.openfoodfacts.org/cgi/search.pl"
@@ -135,6 +136,7 @@ def main():
         time.sleep(DELAY)
 
     db.commit()
+    refresh_product_stats(db)
     db.close()
 
     print(f"\n{'='*70}")
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import SessionLocal
 from app.models.product import Product
+from scripts.pipeline.utils import refresh_product_stats
 
 # Manual nutrition data for products not found in OFF
 # Format: name -> {ean, kcal, protein, carbs, fat, fiber, sugar, salt} per 100g
@@ -251,6 +252,7 @@ def main():
         print(f"  UPDATED: {product_name} ({kcal} kcal/100g)")
 
     db.commit()
+    refresh_product_stats(db)
     db.close()
 
     # Verify
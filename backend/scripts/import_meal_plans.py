@@ -15,9 +15,10 @@ import os
 # Add the parent directory to path so we can import our app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.database import SessionLocal, engine
-from app.models.meal_plan import MealPlan, Meal, Ingredient
+from app.models.meal_plan import MealPlan, Meal, Ingredient, MealType
 from app.models.user import Gender
 
 
@@ -307,55 +308,91 @@ def clear_existing_meal_plans(db: Session):
 
 
 def import_to_database(meal_plans: list[dict], db: Session):
-    """Import parsed meal plans to database."""
-
-    for plan_data in meal_plans:
-        # Create meal plan
-        meal_plan = MealPlan(
-            level=plan_data['level'],
-            day_number=plan_data['day_number'],
-            gender=plan_data['gender'],
-            total_kcal=plan_data['total_kcal'],
-            total_protein=plan_data['total_protein'],
-            total_carbs=plan_data['total_carbs'],
-            total_fat=plan_data['total_fat'],
-            name=plan_data['name'],
-            description=plan_data['description'],
-        )
-
-        # Create meals
+    """
+    Import parsed meal plans to database.
+
+    LEARNING NOTE:
+    Instead of building ORM objects and db.add()-ing them one plan at a time,
+    this collects plain dicts and runs ONE insert() per table. Passing a list
+    of dicts to insert() uses SQLAlchemy 2.0's "insertmanyvalues" mode: rows
+    are sent as multi-row INSERT ... VALUES (...), (...) batches instead of
+    one statement per row.
+
+    Ids come from the database (gen_random_uuid()), so the plan and meal
+    inserts use RETURNING with sort_by_parameter_order=True - the returned ids
+    line up with the rows we sent, which is how the next level gets its
+    foreign keys. Everything is committed in a single transaction at the end.
+    """
+    if not meal_plans:
+        print("\nNothing to import")
+        return
+
+    # --- Level 1: meal plans ---
+    plan_rows = [
+        {
+            'level': plan_data['level'],
+            'day_number': plan_data['day_number'],
+            'gender': Gender(plan_data['gender']),
+            'total_kcal': plan_data['total_kcal'],
+            'total_protein': plan_data['total_protein'],
+            'total_carbs': plan_data['total_carbs'],
+            'total_fat': plan_data['total_fat'],
+            'name': plan_data['name'],
+            'description': plan_data['description'],
+        }
+        for plan_data in meal_plans
+    ]
+    plan_ids = db.scalars(
+        insert(MealPlan).returning(MealPlan.id, sort_by_parameter_order=True),
+        plan_rows,
+    ).all()
+
+    # --- Level 2: meals (need their plan's id) ---
+    meal_rows = []
+    meal_sources = []  # parsed meal dicts, same order as meal_rows
+    for plan_id, plan_data in zip(plan_ids, meal_plans):
         for i, meal_data in enumerate(plan_data['meals']):
-            meal = Meal(
-                meal_type=meal_data['meal_type'],
-                order_index=i,
-                instructions=meal_data.get('instructions'),
-                total_kcal=meal_data['total_kcal'],
-                total_protein=meal_data['total_protein'],
-                total_carbs=meal_data['total_carbs'],
-                total_fat=meal_data['total_fat'],
-            )
-
-            # Create ingredients
-            for ing_data in meal_data['ingredients']:
-                ingredient = Ingredient(
-                    product_name=ing_data['product_name'],
-                    quantity=ing_data['quantity'],
-                    unit=ing_data['unit'],
-                    kcal=ing_data.get('kcal', 0),
-                    protein=ing_data.get('protein', 0),
-                    carbs=ing_data.get('carbs', 0),
-                    fat=ing_data.get('fat', 0),
-                    order_index=ing_data['order_index'],
-                )
-                meal.ingredients.append(ingredient)
-
-            meal_plan.meals.append(meal)
-
-        db.add(meal_plan)
-        print(f"  Added: Level {plan_data['level']} Tag {plan_data['day_number']} ({plan_data['gender']})")
+            meal_rows.append({
+                'meal_plan_id': plan_id,
+                'meal_type': MealType(meal_data['meal_type']),
+                'order_index': i,
+                'instructions': meal_data.get('instructions'),
+                'total_kcal': meal_data['total_kcal'],
+                'total_protein': meal_data['total_protein'],
+                'total_carbs': meal_data['total_carbs'],
+                'total_fat': meal_data['total_fat'],
+            })
+            meal_sources.append(meal_data)
+
+    meal_ids = []
+    if meal_rows:
+        meal_ids = db.scalars(
+            insert(Meal).returning(Meal.id, sort_by_parameter_order=True),
+            meal_rows,
+        ).all()
+
+    # --- Level 3: ingredients (need their meal's id) ---
+    ingredient_rows = [
+        {
+            'meal_id': meal_id,
+            'product_name': ing_data['product_name'],
+            'quantity': ing_data['quantity'],
+            'unit': ing_data['unit'],
+            'kcal': ing_data.get('kcal', 0),
+            'protein': ing_data.get('protein', 0),
+            'carbs': ing_data.get('carbs', 0),
+            'fat': ing_data.get('fat', 0),
+            'order_index': ing_data['order_index'],
+        }
+        for meal_id, meal_data in zip(meal_ids, meal_sources)
+        for ing_data in meal_data['ingredients']
+    ]
+    if ingredient_rows:
+        db.execute(insert(Ingredient), ingredient_rows)
 
     db.commit()
-    print(f"\nCommitted {len(meal_plans)} meal plans to database")
+    print(f"\nCommitted {len(plan_rows)} meal plans, {len(meal_rows)} meals "
+          f"and {len(ingredient_rows)} ingredients to database")
 
 
 def main():
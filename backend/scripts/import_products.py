@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import SessionLocal
 from app.models.product import Product
+from scripts.pipeline.utils import refresh_product_stats
 
 CSV_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
@@ -54,6 +55,7 @@ def main():
         db.add(product)
 
     db.commit()
+    refresh_product_stats(db)
 
     # Verify
     count = db.query(Product).count()
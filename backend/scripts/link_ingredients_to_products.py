@@ -1,7 +1,11 @@
 """
 Link existing meal plan ingredients to product catalog entries.
 
-Matches ingredient.product_name to products.name using prefix/substring matching.
+Matches ingredient.product_name to products.name using prefix/substring matching,
+then copies the product's nutrition onto the ingredient (scaled to its quantity)
+so meal plan pages can show macros without joining the products table.
+
+Re-run after product nutrition changes to refresh the ingredient copies.
 
 Usage:
     cd backend
@@ -13,9 +17,11 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import SessionLocal
+from sqlalchemy import select, update
+
+from app.database import SessionLocal, UTC_NOW
 from app.models.product import Product
-from app.models.meal_plan import Ingredient
+from app.models.meal_plan import Ingredient, Meal, MealPlan
 
 
 def build_product_lookup(products):
@@ -79,25 +85,49 @@ def main():
 
     products = db.query(Product).all()
     lookup = build_product_lookup(products)
+    products_by_id = {p.id: p for p in products}
 
     ingredients = db.query(Ingredient).all()
     print(f"Matching {len(ingredients)} ingredients to {len(products)} products...\n")
 
     linked = 0
+    with_nutrition = 0
     unmatched = set()
+    changed_meal_ids = set()
 
     for ing in ingredients:
         product_id = find_product_id(ing.product_name, lookup, {})
         if product_id:
             ing.product_id = product_id
             linked += 1
+            if ing.copy_nutrition_from(products_by_id[product_id]):
+                with_nutrition += 1
+            # is_modified ignores attributes that were set to the value they had
+            if db.is_modified(ing):
+                changed_meal_ids.add(ing.meal_id)
         else:
             unmatched.add(ing.product_name)
 
+    # LEARNING NOTE:
+    # The meal plan endpoints build their ETag from meal_plans.updated_at
+    # (see app/routers/meal_plans.py). Ingredient rows have no timestamp of
+    # their own, so bump the plans whose ingredients changed - otherwise
+    # clients revalidating with If-None-Match keep getting 304 and show the
+    # old macros.
+    if changed_meal_ids:
+        db.execute(
+            update(MealPlan)
+            .where(MealPlan.id.in_(
+                select(Meal.meal_plan_id).where(Meal.id.in_(changed_meal_ids))
+            ))
+            .values(updated_at=UTC_NOW)
+        )
+
     db.commit()
 
     total = len(ingredients)
     print(f"Linked {linked}/{total} ingredients to products ({linked*100//total}%)")
+    print(f"Copied nutrition onto {with_nutrition}/{linked} linked ingredients")
 
     if unmatched:
         print(f"\nUnmatched ingredient names ({len(unmatched)}):")
@@ -18,15 +18,17 @@ Usage:
 
 import os
 import sys
-import uuid
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from app.database import SessionLocal
+from app.models.ids import uuid7_str
 from app.models.product import Product
-from scripts.pipeline.utils import normalize_for_matching, fuzzy_match, map_bls_category
+from scripts.pipeline.utils import (
+    normalize_for_matching, fuzzy_match, map_bls_category, refresh_product_stats,
+)
 
 DATA_DIR = Path(__file__).resolve().parents[3] / "data" / "raw" / "bls"
 
@@ -234,7 +236,7 @@ def main():
         category = map_bls_category(item["bls_code"])
 
         product = Product(
-            id=str(uuid.uuid4()),
+            id=uuid7_str(),
             name=item["name"],
             brand=None,
             ean=None,
@@ -266,6 +268,7 @@ def main():
 
     if not dry_run:
         db.commit()
+        refresh_product_stats(db)
 
     db.close()
 
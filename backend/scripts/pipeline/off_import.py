@@ -2,7 +2,7 @@
 Fast bulk import of filtered Open Food Facts products into the database.
 
 Reads the filtered JSONL file, deduplicates by EAN (fast dict lookup),
-and bulk inserts new products in large batches.
+and bulk inserts new products in large batches via COPY.
 
 Usage:
     cd backend
@@ -12,14 +12,15 @@ Usage:
 import os
 import sys
 import json
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from app.database import SessionLocal
-from app.models.product import Product
+from app.models.ids import uuid7_str
+from app.models.product import Product, image_key_from_url
+from scripts.pipeline.utils import bulk_insert, refresh_product_stats
 
 DATA_DIR = Path(__file__).resolve().parents[3] / "data"
 INPUT_FILE = DATA_DIR / "processed" / "off_german_products.jsonl"
@@ -99,37 +100,39 @@ def main():
         new_products = []
 
         for item in batch:
-            product = Product(
-                id=str(uuid.uuid4()),
-                name=item["name"][:255],
-                brand=(item.get("brand") or "")[:255] or None,
-                ean=item.get("ean")[:13] if item.get("ean") and len(item.get("ean")) <= 13 else None,
-                category=item.get("category", "Other"),
-                package_size=None,
-                unit=None,
-                calories_per_100g=item.get("calories_per_100g"),
-                protein_per_100g=item.get("protein_per_100g"),
-                carbs_per_100g=item.get("carbs_per_100g"),
-                fat_per_100g=item.get("fat_per_100g"),
-                fiber_per_100g=item.get("fiber_per_100g"),
-                sugar_per_100g=item.get("sugar_per_100g"),
-                salt_per_100g=item.get("salt_per_100g"),
-                data_source="off",
-                data_confidence=item.get("data_confidence", 0.3),
-                is_curated=False,
-                off_id=item.get("off_id"),
-                nutriscore_grade=item.get("nutriscore_grade") if item.get("nutriscore_grade") in ("a","b","c","d","e") else None,
-                image_url=item.get("image_url"),
-                image_thumb_url=item.get("image_thumb_url"),
-                last_synced_at=now,
-            )
-            new_products.append(product)
-
-        db.bulk_save_objects(new_products)
+            new_products.append({
+                "id": uuid7_str(),
+                "name": item["name"][:255],
+                "brand": (item.get("brand") or "")[:255] or None,
+                "ean": item.get("ean")[:13] if item.get("ean") and len(item.get("ean")) <= 13 else None,
+                "category": item.get("category", "Other"),
+                "package_size": None,
+                "unit": None,
+                "calories_per_100g": item.get("calories_per_100g"),
+                "protein_per_100g": item.get("protein_per_100g"),
+                "carbs_per_100g": item.get("carbs_per_100g"),
+                "fat_per_100g": item.get("fat_per_100g"),
+                "fiber_per_100g": item.get("fiber_per_100g"),
+                "sugar_per_100g": item.get("sugar_per_100g"),
+                "salt_per_100g": item.get("salt_per_100g"),
+                "data_source": "off",
+                "data_confidence": item.get("data_confidence", 0.3),
+                "is_curated": False,
+                "off_id": item.get("off_id"),
+                "nutriscore_grade": item.get("nutriscore_grade") if item.get("nutriscore_grade") in ("a","b","c","d","e") else None,
+                "image_key": image_key_from_url(item.get("image_url")),
+                "image_thumb_key": image_key_from_url(item.get("image_thumb_url")),
+                "last_synced_at": now,
+                # created_at/updated_at come from the columns' server defaults
+            })
+
+        # Plain dicts + COPY: no Product objects are built at all
+        bulk_insert(db, Product, new_products)
         db.commit()
         inserted += len(new_products)
         print(f"  Inserted {inserted:,} / {len(unique_products):,}")
 
+    refresh_product_stats(db)
     db.close()
 
     print(f"\n{'='*60}")
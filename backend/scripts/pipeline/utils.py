@@ -5,9 +5,14 @@ Provides normalization, fuzzy matching, category mapping, and confidence scoring
 used across all pipeline scripts (OFF, BLS, dedup).
 """
 
+import csv
+import io
+import json
 import re
 from difflib import SequenceMatcher
 
+from sqlalchemy import insert, text
+
 
 # ---------------------------------------------------------------------------
 # Text normalization
@@ -233,3 +238,78 @@ def compute_confidence(data_source: str, completeness: float = 0.0) -> float:
         else:
             return 0.3
     return 0.3
+
+
+# ---------------------------------------------------------------------------
+# Bulk loading
+# ---------------------------------------------------------------------------
+
+# Below this many rows a plain multi-row INSERT is just as fast as COPY
+COPY_THRESHOLD = 100
+
+# Marker COPY reads back as NULL (kept distinct from an empty string)
+_COPY_NULL = "\\N"
+
+
+def _copy_value(value):
+    """Format one value for COPY's CSV input."""
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (dict, list)):
+        # JSON/JSONB columns (e.g. ProductSourceLink.external_data)
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def bulk_insert(db, model, rows: list[dict]) -> int:
+    """Insert plain row dicts into a model's table, using COPY for big batches.
+
+    Every row must have the same keys (column names). COPY bypasses the ORM,
+    so only server-side defaults apply: ids and timestamps are filled in by
+    the database, but Python-side defaults (e.g. the UUIDv7 ids) are not.
+
+    Runs on the session's current transaction; the caller commits.
+
+    Returns:
+        Number of rows inserted.
+    """
+    if not rows:
+        return 0
+
+    if len(rows) < COPY_THRESHOLD:
+        db.execute(insert(model), rows)
+        return len(rows)
+
+    columns = list(rows[0].keys())
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    for row in rows:
+        writer.writerow(_copy_value(row[c]) for c in columns)
+    buf.seek(0)
+
+    # COPY streams all rows in one command: no per-row statement parsing,
+    # planning or round trips like executemany INSERTs have.
+    cursor = db.connection().connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buf,
+        )
+    finally:
+        cursor.close()
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Derived data
+# ---------------------------------------------------------------------------
+
+def refresh_product_stats(db) -> None:
+    """Recompute the product_stats_mv materialized view behind /products/stats.
+
+    Call this after a script has committed its product changes. CONCURRENTLY
+    keeps the view readable while it is rebuilt, so the API never waits.
+    """
+    db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY product_stats_mv"))
+    db.commit()
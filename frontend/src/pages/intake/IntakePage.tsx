@@ -7,8 +7,10 @@
  * 2. Weight goals (current, goal)
  * 3. Activity & preferences
  *
- * We manage the current screen with useState and
- * save progress after each screen to the backend.
+ * We manage the current screen with useState and keep every
+ * screen's answers in the browser. Only the last screen talks to the
+ * backend: one POST /users/me/intake with everything, saved in a single
+ * database transaction.
  *
  * TUTORIAL: https://react.dev/learn/sharing-state-between-components
  */
@@ -55,15 +57,12 @@ export default function IntakePage() {
     setIsLoading(true);
 
     try {
-      if (currentScreen === 1) {
-        await userApi.saveIntakeScreen1(screen1Data);
-        setCurrentScreen(2);
-      } else if (currentScreen === 2) {
-        await userApi.saveIntakeScreen2(screen2Data);
-        setCurrentScreen(3);
-      } else if (currentScreen === 3) {
-        // Final screen - complete intake
-        await userApi.saveIntakeScreen3(screen3Data);
+      if (currentScreen < TOTAL_SCREENS) {
+        // Answers stay in state until the last screen
+        setCurrentScreen(currentScreen + 1);
+      } else {
+        // Final screen - submit all screens at once
+        await userApi.completeIntake({ ...screen1Data, ...screen2Data, ...screen3Data });
         // Refresh user data (will now have intake_completed: true)
         await fetchUser();
         // Navigation to dashboard happens automatically via IntakeRoute
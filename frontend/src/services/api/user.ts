@@ -33,6 +33,7 @@ export const userApi = {
 
   /**
    * Save intake screen 1 (partial)
+   * @deprecated IntakePage submits everything at once via completeIntake
    */
   saveIntakeScreen1: async (data: IntakeScreen1): Promise<void> => {
     await apiClient.post('/users/me/intake/screen1', data);
@@ -40,6 +41,7 @@ export const userApi = {
 
   /**
    * Save intake screen 2 (partial)
+   * @deprecated IntakePage submits everything at once via completeIntake
    */
   saveIntakeScreen2: async (data: IntakeScreen2): Promise<void> => {
     await apiClient.post('/users/me/intake/screen2', data);
@@ -47,6 +49,7 @@ export const userApi = {
 
   /**
    * Save intake screen 3 and complete intake
+   * @deprecated IntakePage submits everything at once via completeIntake
    */
   saveIntakeScreen3: async (data: IntakeScreen3): Promise<UserProfile> => {
     const response = await apiClient.post<UserProfile>('/users/me/intake/screen3', data);